@@ -4,10 +4,68 @@
 실러버스, 일별 콘텐츠, 템플릿 등을 생성하는 엔진들을 포함합니다.
 """
 
+from .exceptions import ContentGenerationError, ContentSourceError
+from .content_source import (
+    PROMPT_VERSION,
+    SECTIONS,
+    ContentRequest,
+    ContentSource,
+    ContentSourceClient,
+    LocalContentPackSource,
+    StubContentSource,
+)
+from .response_cache import CacheStats, ResponseCache
+from .daily_content_generator import DailyContentGenerator
+from .checkpoint import CheckpointMismatchError, GenerationJournal, QuarantinedUnit
+from .orchestrator import GenerationOrchestrator, GenerationReport
+from .output_writer import iter_daily_content
+from .syllabus_renderer import SyllabusOutputs, iter_generated_days, render_syllabus_outputs
+from .work_queue import DistributedWorker, WorkQueue, WorkUnit, shard_curricula
+from .archive_exporter import ArchiveSummary, archive_format, export_archive, iter_export_files
+
+__all__ = [
+    # Errors
+    "ContentGenerationError",
+    "ContentSourceError",
+    # Content sources
+    "PROMPT_VERSION",
+    "SECTIONS",
+    "ContentRequest",
+    "ContentSource",
+    "ContentSourceClient",
+    "LocalContentPackSource",
+    "StubContentSource",
+    # Cache
+    "CacheStats",
+    "ResponseCache",
+    # Generators
+    "DailyContentGenerator",
+    # Orchestration
+    "CheckpointMismatchError",
+    "GenerationJournal",
+    "QuarantinedUnit",
+    "GenerationOrchestrator",
+    "GenerationReport",
+    # Output
+    "iter_daily_content",
+    "iter_generated_days",
+    "render_syllabus_outputs",
+    "SyllabusOutputs",
+    # Distributed generation
+    "DistributedWorker",
+    "WorkQueue",
+    "WorkUnit",
+    "shard_curricula",
+    # Archive export
+    "ArchiveSummary",
+    "archive_format",
+    "export_archive",
+    "iter_export_files",
+]
+
 # 향후 구현될 생성기들:
 # - CurriculumPlanner
 # - SyllabusGenerator
-# - DailyContentGenerator
 # - TemplateEngine
 # - ReadmeGenerator
 # - ConsoleLabGenerator
@@ -0,0 +1,326 @@
+"""
+출력 트리 아카이브 내보내기
+
+생성된 커리큘럼 출력 트리(`week{n}/day{n}/...`와 실러버스/색인 파일)를
+학습자 배포용 아카이브 하나로 묶습니다. 파일은 임시 디렉토리에 모으지 않고
+읽는 즉시 아카이브에 기록합니다.
+
+- `.tar.zst`: 전체 트리를 하나의 tar 스트림(solid)으로 zstd 압축합니다.
+  파일 간 반복되는 CDK/CI 보일러플레이트가 같은 압축 창 안에서 중복 제거되며,
+  zstd 멀티스레드 모드로 여러 코어에서 압축합니다. `zstandard` 패키지가 필요합니다.
+- `.zip`: 파일별 deflate 압축을 스레드 풀에서 병렬로 수행하고, 결과를 원래
+  순서대로 기록합니다. 추가 의존성 없이 어떤 환경에서도 열 수 있습니다.
+"""
+
+import os
+import re
+import struct
+import tarfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Deque, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .output_writer import CONTENT_FILENAME
+
+
+ARCHIVE_FORMATS = {
+    ".tar.zst": "tar.zst",
+    ".zip": "zip",
+}
+
+DEFAULT_LEVELS = {
+    "tar.zst": 10,
+    "zip": 6,
+}
+
+# zip 헤더 상수 (UTF-8 파일명 플래그, 필요 버전 2.0, zip64 미사용 한계)
+_ZIP_UTF8_FLAG = 0x0800
+_ZIP_VERSION = 20
+_ZIP_MAX_ENTRIES = 0xFFFF
+_ZIP_MAX_SIZE = 0xFFFFFFFF
+_ZIP_LIMIT_MESSAGE = "zip 크기 제한(4GiB, 65535개)을 넘었습니다. .tar.zst 형식을 사용하세요."
+
+
+class ArchiveSummary(BaseModel):
+    """아카이브 내보내기 결과"""
+
+    path: str = Field(..., description="아카이브 경로")
+    format: str = Field(..., description="아카이브 형식 (tar.zst, zip)")
+    files: int = Field(default=0, ge=0, description="포함된 파일 수")
+    raw_bytes: int = Field(default=0, ge=0, description="원본 크기 합계")
+    archive_bytes: int = Field(default=0, ge=0, description="아카이브 크기")
+
+    @property
+    def ratio(self) -> float:
+        """압축률 (아카이브 크기 / 원본 크기)"""
+        return self.archive_bytes / self.raw_bytes if self.raw_bytes else 0.0
+
+
+def archive_format(archive_path: str) -> str:
+    """
+    파일 이름으로 아카이브 형식을 판별합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 확장자인 경우
+    """
+    name = Path(archive_path).name.lower()
+    for suffix, name_format in ARCHIVE_FORMATS.items():
+        if name.endswith(suffix):
+            return name_format
+    raise ValueError(
+        f"지원하지 않는 아카이브 형식입니다: {archive_path} "
+        f"({', '.join(ARCHIVE_FORMATS)} 중 하나를 사용하세요)"
+    )
+
+
+def _natural_key(name: str) -> List:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def iter_export_files(
+    output_directory: str,
+    include_content: bool = False,
+) -> Iterator[Tuple[str, Path]]:
+    """
+    아카이브에 넣을 파일을 (아카이브 내 경로, 실제 경로)로 반환합니다.
+
+    week2가 week10보다 앞서도록 숫자 순서로 정렬하며, 체크포인트/캐시 등
+    숨김 디렉토리와 기록 중인 `.tmp` 파일은 제외합니다. `content.json`은
+    `include_content`가 True일 때만 포함합니다.
+    """
+    root = Path(output_directory)
+
+    def walk(directory: Path) -> Iterator[Tuple[str, Path]]:
+        entries = sorted(directory.iterdir(), key=lambda path: (path.is_dir(), _natural_key(path.name)))
+        for path in entries:
+            if path.name.startswith(".") or path.name.endswith(".tmp"):
+                continue
+            if path.is_dir():
+                yield from walk(path)
+            elif path.is_file():
+                if path.name == CONTENT_FILENAME and not include_content:
+                    continue
+                yield path.relative_to(root).as_posix(), path
+
+    if root.is_dir():
+        yield from walk(root)
+
+
+def _ordered_map(executor: ThreadPoolExecutor, fn, items: Iterator, window: int) -> Iterator:
+    """입력 순서를 유지하며 최대 window개까지만 미리 실행하는 map"""
+    pending: Deque[Future] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _ZipEntry:
+    """deflate 압축을 마친 zip 항목"""
+
+    def __init__(self, arcname: str, path: Path, level: int):
+        stat = path.stat()
+        data = path.read_bytes()
+        self.name = arcname.encode("utf-8")
+        self.mode = stat.st_mode
+        self.mtime = stat.st_mtime
+        self.crc = zlib.crc32(data)
+        self.size = len(data)
+
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        # 압축 효과가 없는 파일은 그대로 저장
+        if len(compressed) < len(data):
+            self.method, self.data = zlib.DEFLATED, compressed
+        else:
+            self.method, self.data = 0, data
+
+    def dos_datetime(self) -> Tuple[int, int]:
+        year, month, day, hour, minute, second = time.localtime(self.mtime)[:6]
+        if year < 1980:
+            year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+        return (
+            (hour << 11) | (minute << 5) | (second // 2),
+            ((year - 1980) << 9) | (month << 5) | day,
+        )
+
+
+def _write_zip(
+    out: BinaryIO,
+    files: Iterator[Tuple[str, Path]],
+    level: int,
+    workers: int,
+    summary: ArchiveSummary,
+) -> None:
+    """
+    파일별 압축을 병렬로 수행하여 zip을 기록합니다.
+
+    zipfile 모듈은 미리 압축된 데이터를 받지 않으므로 로컬 헤더와 중앙
+    디렉토리를 직접 기록합니다 (zip64 미지원: 4GiB, 65535개 이하).
+    """
+    central: List[bytes] = []
+    offset = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        entries = _ordered_map(
+            executor,
+            lambda item: _ZipEntry(item[0], item[1], level),
+            files,
+            window=workers * 4,
+        )
+        for entry in entries:
+            if (
+                len(central) >= _ZIP_MAX_ENTRIES
+                or entry.size > _ZIP_MAX_SIZE
+                or offset + 30 + len(entry.name) + len(entry.data) > _ZIP_MAX_SIZE
+            ):
+                raise ValueError(_ZIP_LIMIT_MESSAGE)
+
+            dos_time, dos_date = entry.dos_datetime()
+            out.write(
+                struct.pack(
+                    "<IHHHHHIIIHH",
+                    0x04034B50,
+                    _ZIP_VERSION,
+                    _ZIP_UTF8_FLAG,
+                    entry.method,
+                    dos_time,
+                    dos_date,
+                    entry.crc,
+                    len(entry.data),
+                    entry.size,
+                    len(entry.name),
+                    0,
+                )
+            )
+            out.write(entry.name)
+            out.write(entry.data)
+            central.append(
+                struct.pack(
+                    "<IHHHHHHIIIHHHHHII",
+                    0x02014B50,
+                    (3 << 8) | _ZIP_VERSION,
+                    _ZIP_VERSION,
+                    _ZIP_UTF8_FLAG,
+                    entry.method,
+                    dos_time,
+                    dos_date,
+                    entry.crc,
+                    len(entry.data),
+                    entry.size,
+                    len(entry.name),
+                    0,
+                    0,
+                    0,
+                    0,
+                    (entry.mode & 0xFFFF) << 16,
+                    offset,
+                )
+                + entry.name
+            )
+            offset += 30 + len(entry.name) + len(entry.data)
+            summary.files += 1
+            summary.raw_bytes += entry.size
+
+    directory = b"".join(central)
+    if offset + len(directory) > _ZIP_MAX_SIZE:
+        raise ValueError(_ZIP_LIMIT_MESSAGE)
+    out.write(directory)
+    out.write(
+        struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central), len(directory), offset, 0)
+    )
+
+
+def _write_tar_zst(
+    out: BinaryIO,
+    files: Iterator[Tuple[str, Path]],
+    level: int,
+    workers: int,
+    summary: ArchiveSummary,
+) -> None:
+    """전체 트리를 하나의 tar 스트림으로 묶어 멀티스레드 zstd로 압축합니다."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            ".tar.zst 내보내기에는 zstandard 패키지가 필요합니다 "
+            "(pip install zstandard). 또는 .zip 형식을 사용하세요."
+        ) from e
+
+    compressor = zstandard.ZstdCompressor(level=level, threads=workers)
+    with compressor.stream_writer(out, closefd=False) as writer:
+        with tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for arcname, path in files:
+                info = tar.gettarinfo(str(path), arcname=arcname)
+                info.uid = info.gid = 0
+                info.uname = info.gname = ""
+                with open(path, "rb") as source:
+                    tar.addfile(info, source)
+                summary.files += 1
+                summary.raw_bytes += info.size
+
+
+def export_archive(
+    output_directory: str,
+    archive_path: str,
+    workers: Optional[int] = None,
+    level: Optional[int] = None,
+    include_content: bool = False,
+) -> ArchiveSummary:
+    """
+    출력 트리를 아카이브로 내보냅니다.
+
+    아카이브는 같은 디렉토리의 임시 파일에 기록한 뒤 완료 시 교체하므로,
+    중간에 실패해도 기존 아카이브가 손상되지 않습니다.
+
+    Args:
+        output_directory: 생성된 커리큘럼 출력 디렉토리
+        archive_path: 아카이브 경로 (.tar.zst 또는 .zip)
+        workers: 압축 스레드 수 (기본값: CPU 수)
+        level: 압축 수준 (기본값: 형식별 DEFAULT_LEVELS)
+        include_content: content.json 포함 여부
+
+    Returns:
+        내보내기 결과
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 출력 디렉토리가 없는 경우
+        ImportError: .tar.zst 형식에 필요한 zstandard가 없는 경우
+    """
+    name_format = archive_format(archive_path)
+    if not Path(output_directory).is_dir():
+        raise ValueError(f"출력 디렉토리가 없습니다: {output_directory}")
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    level = DEFAULT_LEVELS[name_format] if level is None else level
+
+    target = Path(archive_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(target.name + ".tmp")
+    # 출력 디렉토리 안에 아카이브를 만드는 경우 자기 자신은 제외
+    excluded = {target.resolve()}
+    files = (
+        (arcname, path)
+        for arcname, path in iter_export_files(output_directory, include_content)
+        if path.resolve() not in excluded
+    )
+
+    summary = ArchiveSummary(path=str(target), format=name_format)
+    write = _write_zip if name_format == "zip" else _write_tar_zst
+    try:
+        with open(temp_path, "wb") as out:
+            write(out, files, level, workers, summary)
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    summary.archive_bytes = target.stat().st_size
+    return summary
@@ -0,0 +1,174 @@
+"""
+생성 체크포인트 저널
+
+`output_directory/.generation/` 아래에 일차/단계 단위 완료 기록을 남기고,
+실패한 단위는 ContentGenerationError 정보(day, section, details)와 함께
+격리(quarantine)합니다. 재개 시 완료된 단계는 건너뛰고 실패하거나
+시작하지 않은 단위만 다시 실행합니다.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from .exceptions import ContentGenerationError
+
+
+JOURNAL_DIRNAME = ".generation"
+
+Stage = Literal["content", "render"]
+
+# 일차별 처리 단계 (순서대로 실행)
+STAGES: Tuple[Stage, ...] = ("content", "render")
+
+
+class QuarantinedUnit(BaseModel):
+    """격리된 실패 단위"""
+
+    day: int = Field(..., ge=1, description="전체 일차 번호")
+    stage: Stage = Field(..., description="실패한 단계")
+    section: str = Field(..., description="실패한 섹션")
+    details: str = Field(..., description="실패 상세 내용")
+    failed_at: datetime = Field(default_factory=datetime.now, description="실패 시각")
+    attempts: int = Field(default=1, ge=1, description="실패 누적 횟수")
+
+
+class CheckpointMismatchError(ValueError):
+    """저널이 현재 실러버스/설정과 다른 실행의 것인 경우"""
+
+
+class GenerationJournal:
+    """
+    추가 기록(append-only) 방식의 생성 저널
+
+    Args:
+        output_directory: 커리큘럼 출력 디렉토리
+    """
+
+    def __init__(self, output_directory: str):
+        self.directory = Path(output_directory) / JOURNAL_DIRNAME
+        self.journal_path = self.directory / "journal.jsonl"
+        self.quarantine_directory = self.directory / "quarantine"
+        self.fingerprint: Optional[str] = None
+        self._completed: Dict[int, Set[str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 중단 시점에 잘린 마지막 줄은 무시합니다.
+                    continue
+                if record.get("event") == "start":
+                    self.fingerprint = record.get("fingerprint")
+                elif record.get("event") == "done":
+                    self._completed.setdefault(record["day"], set()).add(record["stage"])
+
+    def _append(self, record: Dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record["at"] = datetime.now().isoformat()
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def start(self, fingerprint: str, resume: bool) -> None:
+        """
+        실행을 시작합니다.
+
+        Args:
+            fingerprint: 실러버스/설정 지문
+            resume: True면 기존 저널을 이어서 사용, False면 초기화
+
+        Raises:
+            CheckpointMismatchError: 재개하려는 저널의 지문이 다른 경우
+        """
+        if not resume:
+            self.reset()
+        elif self.fingerprint is not None and self.fingerprint != fingerprint:
+            raise CheckpointMismatchError(
+                "체크포인트가 현재 실러버스/설정과 일치하지 않습니다. --resume 없이 다시 실행하세요"
+            )
+        if self.fingerprint != fingerprint:
+            self.fingerprint = fingerprint
+            self._append({"event": "start", "fingerprint": fingerprint})
+
+    def reset(self) -> None:
+        """저널과 격리 기록을 모두 삭제합니다."""
+        if self.directory.exists():
+            self.journal_path.unlink(missing_ok=True)
+            shutil.rmtree(self.quarantine_directory, ignore_errors=True)
+        self.fingerprint = None
+        self._completed = {}
+
+    def is_done(self, day: int, stage: Stage) -> bool:
+        """단계 완료 여부"""
+        return stage in self._completed.get(day, set())
+
+    def completed_days(self) -> List[int]:
+        """모든 단계를 완료한 일차 목록"""
+        return sorted(day for day, stages in self._completed.items() if set(STAGES) <= stages)
+
+    def record_done(self, day: int, stage: Stage) -> None:
+        """단계 완료 기록"""
+        self._append({"event": "done", "day": day, "stage": stage})
+        self._completed.setdefault(day, set()).add(stage)
+
+    def _quarantine_path(self, day: int) -> Path:
+        return self.quarantine_directory / f"day{day}.json"
+
+    def quarantine(self, error: ContentGenerationError, stage: Stage) -> QuarantinedUnit:
+        """실패 단위를 격리하고 저널에 기록합니다."""
+        previous = self.get_quarantined(error.day)
+        unit = QuarantinedUnit(
+            day=error.day,
+            stage=stage,
+            section=error.section,
+            details=error.details,
+            attempts=previous.attempts + 1 if previous else 1,
+        )
+        self.quarantine_directory.mkdir(parents=True, exist_ok=True)
+        self._quarantine_path(error.day).write_text(unit.model_dump_json(indent=2), encoding="utf-8")
+        self._append(
+            {
+                "event": "failed",
+                "day": error.day,
+                "stage": stage,
+                "section": error.section,
+                "details": error.details,
+            }
+        )
+        return unit
+
+    def release(self, day: int) -> None:
+        """성공한 일차의 격리 기록을 제거합니다."""
+        self._quarantine_path(day).unlink(missing_ok=True)
+
+    def get_quarantined(self, day: int) -> Optional[QuarantinedUnit]:
+        """격리된 일차 정보 조회"""
+        path = self._quarantine_path(day)
+        if not path.exists():
+            return None
+        return QuarantinedUnit.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def quarantined(self) -> List[QuarantinedUnit]:
+        """격리된 모든 단위 (일차 순)"""
+        if not self.quarantine_directory.exists():
+            return []
+        units = [
+            QuarantinedUnit.model_validate_json(path.read_text(encoding="utf-8"))
+            for path in self.quarantine_directory.glob("day*.json")
+        ]
+        return sorted(units, key=lambda unit: unit.day)
@@ -0,0 +1,503 @@
+"""
+콘텐츠 소스 계층
+
+주제, 시나리오, 개념, 퀴즈 등 섹션 콘텐츠를 공급하는 백엔드를 추상화합니다.
+로컬 YAML/JSON 콘텐츠 팩과 텍스트 생성 서비스(로컬 스텁으로 대체 가능)를
+동일한 비동기 인터페이스로 다루며, ContentSourceClient가 동시성 제한,
+요청별 타임아웃, 백오프 재시도, 동일 요청 병합(coalescing)을 담당합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, Field
+
+from ..models.config import CurriculumConfig
+from ..models.syllabus import DayOverview
+from .exceptions import ContentGenerationError, ContentSourceError
+
+if TYPE_CHECKING:
+    from .response_cache import ResponseCache
+
+
+# 프롬프트/콘텐츠 형식이 바뀌면 올려서 이전 결과와 구분합니다.
+PROMPT_VERSION = "1"
+
+SectionName = Literal[
+    "overview",
+    "scenario",
+    "architecture_diagram",
+    "key_concepts",
+    "console_lab",
+    "cdk_lab",
+    "verification",
+    "quiz",
+]
+
+SECTIONS: Tuple[SectionName, ...] = (
+    "overview",
+    "scenario",
+    "architecture_diagram",
+    "key_concepts",
+    "console_lab",
+    "cdk_lab",
+    "verification",
+    "quiz",
+)
+
+# 섹션별로 결과에 영향을 주는 설정 필드
+# (여기 없는 필드, 예: weak_areas는 섹션 요청 키에 포함되지 않습니다)
+SECTION_CONFIG_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "overview": ("language", "target_exam"),
+    "scenario": ("language", "target_exam"),
+    "architecture_diagram": ("language",),
+    "key_concepts": ("language", "target_exam"),
+    "console_lab": ("language", "ec2_access_method", "free_tier_only"),
+    "cdk_lab": (
+        "language",
+        "default_cdk_language",
+        "default_instance_type",
+        "free_tier_only",
+        "cicd_tool",
+        "container_tool",
+        "notification_tool",
+    ),
+    "verification": ("language", "default_cdk_language"),
+    "quiz": ("language", "target_exam"),
+}
+
+
+class ContentRequest(BaseModel):
+    """섹션 콘텐츠 요청"""
+
+    section: SectionName = Field(..., description="섹션 이름")
+    global_day_number: int = Field(..., ge=1, le=30, description="전체 일차 번호")
+    topic: str = Field(..., min_length=1, description="일차 주제")
+    aws_services: Tuple[str, ...] = Field(default=(), description="다루는 AWS 서비스 목록")
+    difficulty: Literal["beginner", "intermediate", "advanced"] = Field(
+        default="beginner",
+        description="난이도"
+    )
+    config_fields: Dict[str, Any] = Field(default_factory=dict, description="섹션 관련 설정값")
+    prompt_version: str = Field(default=PROMPT_VERSION, description="프롬프트 버전")
+
+    class Config:
+        frozen = True
+
+    @classmethod
+    def for_section(
+        cls,
+        section: SectionName,
+        day: DayOverview,
+        config: CurriculumConfig,
+    ) -> "ContentRequest":
+        """일차 정보와 설정에서 섹션 요청 생성"""
+        fields = SECTION_CONFIG_FIELDS[section]
+        return cls(
+            section=section,
+            global_day_number=day.global_day_number,
+            topic=day.topic,
+            aws_services=tuple(day.aws_services),
+            difficulty=day.difficulty,
+            config_fields={name: getattr(config, name) for name in fields},
+        )
+
+    def normalized(self, include_day: bool = False) -> Dict[str, Any]:
+        """
+        정규화된 요청 내용을 반환합니다.
+
+        기본적으로 일차 번호는 포함하지 않으므로, 같은 주제/서비스/난이도/설정의
+        요청은 다른 일차로 옮겨져도 같은 요청으로 취급됩니다. 일차 번호로
+        콘텐츠를 찾는 소스는 `include_day=True`로 일차를 구분합니다.
+        """
+        normalized: Dict[str, Any] = {
+            "section": self.section,
+            "topic": " ".join(self.topic.split()),
+            "aws_services": sorted({s.strip() for s in self.aws_services if s.strip()}),
+            "difficulty": self.difficulty,
+            "config": dict(sorted(self.config_fields.items())),
+            "prompt_version": self.prompt_version,
+        }
+        if include_day:
+            normalized["global_day_number"] = self.global_day_number
+        return normalized
+
+    def key(self, include_day: bool = False, namespace: str = "") -> str:
+        """
+        정규화된 요청의 해시 키
+
+        Args:
+            include_day: 일차 번호 포함 여부
+            namespace: 응답을 만든 소스와 데이터 버전 (ContentSource.cache_namespace)
+        """
+        normalized = self.normalized(include_day)
+        if namespace:
+            normalized["source"] = namespace
+        encoded = json.dumps(normalized, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ContentSource(ABC):
+    """콘텐츠 소스 인터페이스"""
+
+    # 일차 번호로 콘텐츠를 찾는 소스는 True로 두어, 주제가 같은 다른 일차의
+    # 요청이 하나로 병합되지 않게 합니다.
+    keyed_by_day: bool = False
+
+    def cache_namespace(self, request: ContentRequest) -> str:
+        """
+        응답 캐시 키에 포함할 소스 식별자
+
+        소스 종류와 요청에 쓰인 데이터 버전을 나타내며, 값이 바뀌면 이전에
+        캐시된 응답은 더 이상 적중하지 않습니다.
+        """
+        return type(self).__name__
+
+    def request_key(self, request: ContentRequest) -> str:
+        """요청 병합과 응답 캐시에 사용하는 키"""
+        return request.key(include_day=self.keyed_by_day, namespace=self.cache_namespace(request))
+
+    @abstractmethod
+    async def fetch(self, request: ContentRequest) -> Dict[str, Any]:
+        """
+        섹션 콘텐츠를 가져옵니다.
+
+        Args:
+            request: 섹션 콘텐츠 요청
+
+        Returns:
+            섹션 모델 필드에 대응하는 딕셔너리
+
+        Raises:
+            ContentSourceError: 콘텐츠를 가져오지 못한 경우
+        """
+
+
+class LocalContentPackSource(ContentSource):
+    """
+    로컬 YAML/JSON 콘텐츠 팩
+
+    팩 디렉토리에 `day{n}.yaml`, `day{n}.yml` 또는 `day{n}.json` 파일을 두고,
+    각 파일의 최상위 키로 섹션 콘텐츠를 정의합니다.
+    """
+
+    EXTENSIONS = (".yaml", ".yml", ".json")
+    keyed_by_day = True
+
+    def __init__(self, pack_directory: str):
+        self.pack_directory = Path(pack_directory)
+        # 파일 경로 -> (mtime_ns, 크기, 내용 해시, 파싱된 문서)
+        self._snapshots: Dict[Path, Tuple[int, int, str, Dict[str, Any]]] = {}
+
+    def _day_path(self, global_day: int) -> Optional[Path]:
+        for extension in self.EXTENSIONS:
+            path = self.pack_directory / f"day{global_day}{extension}"
+            if path.exists():
+                return path
+        return None
+
+    def _snapshot(self, global_day: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        일차 파일의 (버전, 문서)를 반환합니다.
+
+        해시한 바이트를 그대로 파싱하므로 버전과 문서가 항상 같은 내용에서
+        나오며, 파일이 바뀌면(mtime/크기) 다시 읽어 이전 문서를 버립니다.
+        """
+        path = self._day_path(global_day)
+        if path is None:
+            return f"day{global_day}:missing", {}
+
+        try:
+            stat = path.stat()
+            cached = self._snapshots.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return f"{path.name}:{cached[2]}", cached[3]
+
+            raw = path.read_bytes()
+            text = raw.decode("utf-8")
+            data = json.loads(text) if path.suffix == ".json" else yaml.safe_load(text)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            raise ContentSourceError(f"콘텐츠 팩 로드 오류 ({path}): {e}")
+
+        digest = hashlib.sha256(raw).hexdigest()
+        document = data or {}
+        self._snapshots[path] = (stat.st_mtime_ns, stat.st_size, digest, document)
+        return f"{path.name}:{digest}", document
+
+    def cache_namespace(self, request: ContentRequest) -> str:
+        """팩 경로와 일차 파일 내용 해시 (파일을 수정하면 캐시가 적중하지 않음)"""
+        root = self.pack_directory.resolve()
+        try:
+            version, _ = self._snapshot(request.global_day_number)
+        except ContentSourceError:
+            version = f"day{request.global_day_number}:unreadable"
+        return f"pack:{root}:{version}"
+
+    async def fetch(self, request: ContentRequest) -> Dict[str, Any]:
+        day = request.global_day_number
+        _, document = await asyncio.to_thread(self._snapshot, day)
+
+        payload = document.get(request.section)
+        if payload is None:
+            raise ContentSourceError(
+                f"콘텐츠 팩에 Day {day}의 {request.section} 섹션이 없습니다"
+            )
+        if request.section == "architecture_diagram" and isinstance(payload, str):
+            return {"mermaid": payload}
+        return payload
+
+
+class StubContentSource(ContentSource):
+    """
+    텍스트 생성 서비스를 대신하는 로컬 스텁
+
+    요청 내용만으로 결정적인 기본 콘텐츠를 만들어, 실제 서비스 없이
+    생성 파이프라인 전체를 실행할 수 있게 합니다.
+    """
+
+    def cache_namespace(self, request: ContentRequest) -> str:
+        return "stub"
+
+    async def fetch(self, request: ContentRequest) -> Dict[str, Any]:
+        builder = getattr(self, f"_build_{request.section}")
+        return builder(request)
+
+    @staticmethod
+    def _services(request: ContentRequest) -> Tuple[str, ...]:
+        return request.aws_services or ("AWS",)
+
+    def _build_overview(self, request: ContentRequest) -> Dict[str, Any]:
+        return {
+            "description": f"{request.topic} 주제를 실습 중심으로 학습합니다.",
+            "learning_objectives": [
+                f"{service}의 핵심 동작 원리를 설명할 수 있다" for service in self._services(request)
+            ],
+            "prerequisites": [],
+        }
+
+    def _build_scenario(self, request: ContentRequest) -> Dict[str, Any]:
+        return {
+            "context": f"스타트업 인프라 팀이 {request.topic} 기반 아키텍처를 구축합니다.",
+            "business_requirements": ["비용을 Free Tier 범위 내로 유지해야 합니다"],
+            "technical_challenges": [
+                f"{service} 구성을 안전하게 자동화해야 합니다" for service in self._services(request)
+            ],
+        }
+
+    def _build_architecture_diagram(self, request: ContentRequest) -> Dict[str, Any]:
+        lines = ["graph TB", "    User[사용자]"]
+        for index, service in enumerate(self._services(request), start=1):
+            lines.append(f"    User --> S{index}[{service}]")
+        return {"mermaid": "\n".join(lines)}
+
+    def _build_key_concepts(self, request: ContentRequest) -> Dict[str, Any]:
+        return {
+            "concepts": [
+                {
+                    "name": service,
+                    "what": f"{service}는 {request.topic}에서 사용하는 AWS 서비스입니다.",
+                    "why": f"시나리오의 요구사항을 충족하기 위해 {service}가 필요합니다.",
+                    "official_docs": ["https://docs.aws.amazon.com/"],
+                }
+                for service in self._services(request)
+            ]
+        }
+
+    def _build_console_lab(self, request: ContentRequest) -> Dict[str, Any]:
+        services = self._services(request)
+        return {
+            "objectives": [f"콘솔에서 {service} 리소스 간 관계를 이해한다" for service in services],
+            "procedures": [
+                {
+                    "step_number": index,
+                    "title": f"{service} 생성",
+                    "instructions": [f"AWS 콘솔에서 {service} 콘솔로 이동합니다"],
+                }
+                for index, service in enumerate(services, start=1)
+            ],
+            "cleanup_steps": [
+                {
+                    "step_number": index,
+                    "resource_type": service,
+                    "deletion_order": index,
+                    "instructions": [f"{service} 리소스를 삭제합니다"],
+                }
+                for index, service in enumerate(reversed(services), start=1)
+            ],
+        }
+
+    def _build_cdk_lab(self, request: ContentRequest) -> Dict[str, Any]:
+        config = request.config_fields
+        return {
+            "language": config.get("default_cdk_language", "typescript"),
+            "instance_type": config.get("default_instance_type", "t2.micro"),
+            "security_group_rules": [{"port": 22, "description": "VS Code Remote SSH"}],
+            "key_pair_name": "saa-lab-key",
+            "stack_code": "Tags.of(stack).add('Project', 'saa-c03');",
+        }
+
+    def _build_verification(self, request: ContentRequest) -> Dict[str, Any]:
+        return {
+            "objectives": [f"{service} 리소스 생성 여부를 검증한다" for service in self._services(request)],
+            "test_cases": [
+                {
+                    "name": f"test_{index}",
+                    "description": f"{service} 리소스가 생성되었는지 확인합니다",
+                }
+                for index, service in enumerate(self._services(request), start=1)
+            ],
+        }
+
+    def _build_quiz(self, request: ContentRequest) -> Dict[str, Any]:
+        services = self._services(request)
+        return {
+            "questions": [
+                {
+                    "question_number": number,
+                    "question_text": f"{request.topic}에 대한 {number}번 문제입니다.",
+                    "options": ["A. 보기 1", "B. 보기 2", "C. 보기 3", "D. 보기 4"],
+                    "correct_answer": "A",
+                    "explanation": "보기 1이 요구사항을 가장 잘 충족합니다.",
+                    "related_concept": services[(number - 1) % len(services)],
+                }
+                for number in range(1, 6)
+            ]
+        }
+
+
+class ContentSourceClient:
+    """
+    콘텐츠 소스 비동기 클라이언트
+
+    - Semaphore로 동시 요청 수 제한
+    - 요청별 타임아웃
+    - 지수 백오프 재시도 (기본 3회 재시도)
+    - 진행 중인 동일 요청 병합
+    - 응답 캐시 (선택)
+    """
+
+    def __init__(
+        self,
+        source: ContentSource,
+        max_concurrency: int = 8,
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        cache: Optional["ResponseCache"] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다")
+        if max_retries < 0:
+            raise ValueError("max_retries는 0 이상이어야 합니다")
+
+        self.source = source
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 생성해야 하므로 지연 생성합니다.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def fetch(self, request: ContentRequest) -> Dict[str, Any]:
+        """
+        섹션 콘텐츠를 가져옵니다.
+
+        캐시에 있으면 캐시된 응답을 반환하고, 같은 키의 요청이 이미 진행 중이면
+        새로 호출하지 않고 그 결과를 공유합니다.
+
+        Raises:
+            ContentGenerationError: 모든 재시도가 실패한 경우
+        """
+        key = self.source.request_key(request)
+        cached = await self._cache_get(request, key)
+        if cached is not None:
+            return cached
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            try:
+                result = await self._fetch_with_retry(request)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+                future.exception()
+                raise
+
+            # 대기자를 먼저 깨운 뒤 저장하며, 저장하는 동안 들어온 같은 요청은
+            # 이미 완료된 future를 공유합니다.
+            future.set_result(result)
+            await self._cache_put(request, result, key)
+            return result
+        finally:
+            # 어떤 경로로 빠져나가도 병합된 대기자가 멈춰 있지 않도록 보장
+            if not future.done():
+                future.set_exception(ContentSourceError("요청이 완료되지 않았습니다"))
+                future.exception()
+            del self._in_flight[key]
+
+    async def _cache_get(self, request: ContentRequest, key: str) -> Optional[Dict[str, Any]]:
+        # 캐시의 SQLite 조회/기록은 잠금 대기로 블로킹될 수 있으므로 스레드에서 실행합니다.
+        if self.cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.cache.get, request, key)
+        except (sqlite3.Error, OSError):
+            # 캐시는 최선 노력: 잠긴 데이터베이스 등은 미적중으로 취급합니다.
+            self.cache.stats.errors += 1
+            return None
+
+    async def _cache_put(self, request: ContentRequest, payload: Dict[str, Any], key: str) -> None:
+        if self.cache is None:
+            return
+        try:
+            await asyncio.to_thread(self.cache.put, request, payload, key)
+        except (sqlite3.Error, OSError):
+            # 캐시 저장 실패로 요청을 실패시키지 않습니다.
+            self.cache.stats.errors += 1
+
+    async def _fetch_with_retry(self, request: ContentRequest) -> Dict[str, Any]:
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(self._backoff_delay(attempt - 1))
+            try:
+                async with self._get_semaphore():
+                    return await asyncio.wait_for(self.source.fetch(request), self.timeout)
+            except asyncio.TimeoutError:
+                last_error = ContentSourceError(f"{self.timeout}초 내에 응답이 없습니다")
+            except (ContentSourceError, OSError) as e:
+                last_error = e
+
+        raise ContentGenerationError(
+            request.global_day_number,
+            request.section,
+            f"{self.max_retries}회 재시도 후 실패: {last_error}",
+        )
@@ -0,0 +1,118 @@
+"""
+일별 콘텐츠 생성기
+
+콘텐츠 소스에서 섹션별 콘텐츠를 가져와 DailyContent 객체를 조립합니다.
+모든 일차의 모든 섹션 요청을 한 번에 발행하고, 실제 동시 실행 수는
+ContentSourceClient의 동시성 제한이 조절합니다.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from ..models.config import CurriculumConfig
+from ..models.daily_content import (
+    CdkLabContent,
+    ConsoleLabContent,
+    DailyContent,
+    DailyContentMetadata,
+    KeyConceptsSection,
+    OverviewSection,
+    Quiz,
+    ScenarioSection,
+    VerificationContent,
+)
+from ..models.syllabus import DayOverview, Syllabus
+from .content_source import SECTIONS, ContentRequest, ContentSourceClient, SectionName
+from .exceptions import ContentGenerationError
+
+
+SECTION_MODELS: Dict[str, Type[BaseModel]] = {
+    "overview": OverviewSection,
+    "scenario": ScenarioSection,
+    "key_concepts": KeyConceptsSection,
+    "console_lab": ConsoleLabContent,
+    "cdk_lab": CdkLabContent,
+    "verification": VerificationContent,
+    "quiz": Quiz,
+}
+
+
+class DailyContentGenerator:
+    """일별 콘텐츠 생성기"""
+
+    def __init__(self, client: ContentSourceClient, config: CurriculumConfig):
+        self.client = client
+        self.config = config
+
+    def sections_for(self, day: DayOverview) -> Tuple[SectionName, ...]:
+        """설정에 따라 생성할 섹션 목록"""
+        skipped = set()
+        if not self.config.include_architecture_diagrams:
+            skipped.add("architecture_diagram")
+        if not self.config.include_verification_tests:
+            skipped.add("verification")
+        return tuple(section for section in SECTIONS if section not in skipped)
+
+    async def generate_section(self, day: DayOverview, section: SectionName) -> Any:
+        """
+        단일 섹션 콘텐츠를 생성합니다.
+
+        Returns:
+            섹션 모델 객체 (architecture_diagram은 Mermaid 문자열)
+
+        Raises:
+            ContentGenerationError: 콘텐츠를 가져오거나 검증하지 못한 경우
+        """
+        request = ContentRequest.for_section(section, day, self.config)
+        payload = await self.client.fetch(request)
+
+        try:
+            if section == "architecture_diagram":
+                return str(payload["mermaid"])
+            model: BaseModel = SECTION_MODELS[section].model_validate(payload)
+            return model
+        except (KeyError, TypeError, ValidationError) as e:
+            raise ContentGenerationError(
+                day.global_day_number,
+                section,
+                f"콘텐츠 형식 오류: {e}",
+            )
+
+    async def generate_daily_content(self, week_number: int, day: DayOverview) -> DailyContent:
+        """한 일차의 모든 섹션을 동시에 생성하여 DailyContent로 조립"""
+        sections = self.sections_for(day)
+        results = await asyncio.gather(
+            *(self.generate_section(day, section) for section in sections)
+        )
+        return self._assemble(week_number, day, dict(zip(sections, results)))
+
+    async def generate_syllabus_content(self, syllabus: Syllabus) -> List[DailyContent]:
+        """
+        실러버스 전체 일차의 콘텐츠를 생성합니다.
+
+        모든 일차를 동시에 발행하며, 결과는 실러버스 순서를 따릅니다.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.generate_daily_content(week.week_number, day)
+                    for week, day in syllabus.iter_days()
+                )
+            )
+        )
+
+    def _assemble(
+        self,
+        week_number: int,
+        day: DayOverview,
+        sections: Dict[str, Any],
+    ) -> DailyContent:
+        metadata = DailyContentMetadata(
+            day_number=day.day_number,
+            week_number=week_number,
+            global_day_number=day.global_day_number,
+            topic=day.topic,
+        )
+        return DailyContent(metadata=metadata, **sections)
@@ -0,0 +1,26 @@
+"""
+콘텐츠 생성 예외
+
+설계 문서의 Error Handling Strategy에 정의된 예외 타입들입니다.
+"""
+
+
+class ContentSourceError(Exception):
+    """콘텐츠 소스 호출 실패 (재시도 가능)"""
+
+
+class ContentGenerationError(Exception):
+    """
+    일차/섹션 단위 콘텐츠 생성 실패
+
+    Attributes:
+        day: 전체 일차 번호
+        section: 실패한 섹션 이름
+        details: 실패 상세 내용
+    """
+
+    def __init__(self, day: int, section: str, details: str):
+        self.day = day
+        self.section = section
+        self.details = details
+        super().__init__(f"Day {day} - {section}: {details}")
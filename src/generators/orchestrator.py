@@ -0,0 +1,154 @@
+"""
+생성 오케스트레이터
+
+실러버스 전체 일차를 최대 chunk_size개씩 동시에 생성하고, 일차/단계마다 체크포인트를
+남깁니다. 한 일차의 실패는 해당 단위만 격리하고 나머지 일차는 계속
+진행하므로, 실패 비용이 실행 전체가 아닌 실패한 단위로 한정됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..models.config import CurriculumConfig
+from ..models.daily_content import DailyContent
+from ..models.syllabus import DayOverview, Syllabus
+from .checkpoint import STAGES, GenerationJournal, QuarantinedUnit, Stage
+from .daily_content_generator import DailyContentGenerator
+from .exceptions import ContentGenerationError
+from .output_writer import (
+    content_path,
+    load_daily_content,
+    render_daily_content,
+    save_daily_content,
+)
+
+
+class GenerationReport(BaseModel):
+    """생성 실행 결과"""
+
+    generated: List[int] = Field(default_factory=list, description="이번 실행에서 완료한 일차")
+    skipped: List[int] = Field(default_factory=list, description="체크포인트로 건너뛴 일차")
+    failed: List[QuarantinedUnit] = Field(default_factory=list, description="격리된 실패 단위")
+
+    @property
+    def succeeded(self) -> bool:
+        """실패 단위 없이 완료했는지 여부"""
+        return not self.failed
+
+
+def syllabus_fingerprint(syllabus: Syllabus, config: CurriculumConfig) -> str:
+    """실러버스 구조와 설정의 지문 (생성 시각 등 메타데이터 제외)"""
+    payload = {
+        "weeks": syllabus.model_dump(mode="json")["weeks"],
+        "config": config.model_dump(mode="json"),
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class GenerationOrchestrator:
+    """
+    체크포인트 기반 생성 오케스트레이터
+
+    Args:
+        generator: 일별 콘텐츠 생성기
+        output_directory: 출력 디렉토리 (기본값: 설정의 output_directory)
+        chunk_size: 동시에 진행할 최대 일차 수 (한 일차가 끝나면 바로 다음 일차 시작)
+    """
+
+    def __init__(
+        self,
+        generator: DailyContentGenerator,
+        output_directory: Optional[str] = None,
+        chunk_size: int = 7,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+
+        self.generator = generator
+        self.output_directory = output_directory or generator.config.output_directory
+        self.chunk_size = chunk_size
+        self.journal = GenerationJournal(self.output_directory)
+
+    async def run(self, syllabus: Syllabus, resume: bool = False) -> GenerationReport:
+        """
+        실러버스 전체를 생성합니다.
+
+        Args:
+            syllabus: 생성할 실러버스
+            resume: True면 저널의 마지막 완료 지점부터 재개
+
+        Raises:
+            CheckpointMismatchError: 재개하려는 저널이 다른 실러버스/설정의 것인 경우
+        """
+        self.journal.start(syllabus_fingerprint(syllabus, self.generator.config), resume)
+        report = GenerationReport()
+
+        pending: List[Tuple[int, DayOverview]] = []
+        for week, day in syllabus.iter_days():
+            if all(self.journal.is_done(day.global_day_number, stage) for stage in STAGES):
+                report.skipped.append(day.global_day_number)
+            else:
+                pending.append((week.week_number, day))
+
+        # 청크 경계에서 기다리지 않도록, 한 일차가 끝나는 즉시 다음 일차를 시작하는 창
+        window = asyncio.Semaphore(self.chunk_size)
+
+        async def run_in_window(week_number: int, day: DayOverview) -> Optional[QuarantinedUnit]:
+            async with window:
+                return await self._run_unit(week_number, day)
+
+        results = await asyncio.gather(
+            *(run_in_window(week_number, day) for week_number, day in pending)
+        )
+        for (_, day), failure in zip(pending, results):
+            if failure is None:
+                report.generated.append(day.global_day_number)
+            else:
+                report.failed.append(failure)
+
+        return report
+
+    async def _load_checkpointed_content(
+        self,
+        week_number: int,
+        global_day: int,
+    ) -> Optional[DailyContent]:
+        """content 단계가 완료된 일차의 저장된 콘텐츠 (없거나 손상되었으면 None)"""
+        if not self.journal.is_done(global_day, "content"):
+            return None
+        try:
+            return await asyncio.to_thread(
+                load_daily_content,
+                content_path(self.output_directory, week_number, global_day),
+            )
+        except (OSError, ValueError):
+            return None
+
+    async def _run_unit(self, week_number: int, day: DayOverview) -> Optional[QuarantinedUnit]:
+        global_day = day.global_day_number
+        stage: Stage = "content"
+        try:
+            content = await self._load_checkpointed_content(week_number, global_day)
+            if content is None:
+                content = await self.generator.generate_daily_content(week_number, day)
+                await asyncio.to_thread(save_daily_content, content, self.output_directory)
+                self.journal.record_done(global_day, "content")
+
+            stage = "render"
+            await asyncio.to_thread(render_daily_content, content, self.output_directory)
+            self.journal.record_done(global_day, "render")
+        except ContentGenerationError as e:
+            return self.journal.quarantine(e, stage)
+        except OSError as e:
+            return self.journal.quarantine(ContentGenerationError(global_day, stage, str(e)), stage)
+        except Exception as e:
+            # 소스/검증의 예기치 않은 오류도 해당 일차만 격리하고 나머지 일차는 계속 진행
+            return self.journal.quarantine(ContentGenerationError(global_day, stage, repr(e)), stage)
+
+        self.journal.release(global_day)
+        return None
@@ -0,0 +1,201 @@
+"""
+일별 콘텐츠 출력
+
+DailyContent를 `week{n}/day{n}/` 디렉토리에 기록합니다.
+
+- `content.json`: 생성된 DailyContent 원본 (재개 및 후처리용)
+- `README.md`: 통합 가이드
+- `part1_console/README.md`: 콘솔 실습 가이드
+- `part2_cdk/README.md`: CDK 실습 가이드
+"""
+
+import re
+from pathlib import Path
+from typing import Iterator, List
+
+from ..models.daily_content import CdkLabContent, ConsoleLabContent, DailyContent
+from ..utils.file_utils import read_file, write_file
+
+
+CONTENT_FILENAME = "content.json"
+CONSOLE_DIRNAME = "part1_console"
+CDK_DIRNAME = "part2_cdk"
+
+
+def day_directory(output_directory: str, week_number: int, global_day_number: int) -> Path:
+    """일차 출력 디렉토리 경로 (week{n}/day{n})"""
+    return Path(output_directory) / f"week{week_number}" / f"day{global_day_number}"
+
+
+def content_path(output_directory: str, week_number: int, global_day_number: int) -> Path:
+    """content.json 경로"""
+    return day_directory(output_directory, week_number, global_day_number) / CONTENT_FILENAME
+
+
+def save_daily_content(content: DailyContent, output_directory: str) -> Path:
+    """DailyContent를 content.json으로 저장"""
+    metadata = content.metadata
+    path = content_path(output_directory, metadata.week_number, metadata.global_day_number)
+    write_file(str(path), content.model_dump_json(indent=2))
+    return path
+
+
+def load_daily_content(path: Path) -> DailyContent:
+    """content.json에서 DailyContent 로드"""
+    return DailyContent.model_validate_json(read_file(str(path)))
+
+
+def _numbered(parent: Path, prefix: str) -> List[Path]:
+    pattern = re.compile(rf"{prefix}(\d+)$")
+    matches = [(int(m.group(1)), path) for path in parent.iterdir() if (m := pattern.match(path.name))]
+    return [path for _, path in sorted(matches)]
+
+
+def iter_daily_content(output_directory: str) -> Iterator[DailyContent]:
+    """
+    생성된 출력 트리의 DailyContent를 주차/일차 순서로 하나씩 로드합니다.
+
+    한 번에 한 일차만 메모리에 올리므로 대용량 출력에도 사용할 수 있습니다.
+    content.json이 없는 일차 디렉토리는 건너뜁니다.
+    """
+    root = Path(output_directory)
+    if not root.exists():
+        return
+    for week_dir in _numbered(root, "week"):
+        for day_dir in _numbered(week_dir, "day"):
+            path = day_dir / CONTENT_FILENAME
+            if path.exists():
+                yield load_daily_content(path)
+
+
+def render_daily_content(content: DailyContent, output_directory: str) -> Path:
+    """
+    일차 디렉토리에 README.md와 실습 가이드를 기록합니다.
+
+    Returns:
+        일차 디렉토리 경로
+    """
+    metadata = content.metadata
+    directory = day_directory(output_directory, metadata.week_number, metadata.global_day_number)
+    write_file(str(directory / "README.md"), render_readme(content))
+    write_file(str(directory / CONSOLE_DIRNAME / "README.md"), render_console_lab(content.console_lab))
+    write_file(str(directory / CDK_DIRNAME / "README.md"), render_cdk_lab(content.cdk_lab))
+    return directory
+
+
+def _bullets(items: List[str]) -> List[str]:
+    return [f"- {item}" for item in items]
+
+
+def render_readme(content: DailyContent) -> str:
+    """일차 README.md 렌더링"""
+    metadata = content.metadata
+    lines = [f"# Day {metadata.global_day_number}: {metadata.topic}", ""]
+
+    lines += ["## Overview", "", content.overview.description, ""]
+    if content.overview.learning_objectives:
+        lines += ["### 학습 목표", ""] + _bullets(content.overview.learning_objectives) + [""]
+    if content.overview.prerequisites:
+        lines += ["### 선수 지식", ""] + _bullets(content.overview.prerequisites) + [""]
+
+    lines += ["### 실제 시나리오", "", content.scenario.context, ""]
+    lines += _bullets(content.scenario.business_requirements + content.scenario.technical_challenges)
+    lines.append("")
+
+    if content.architecture_diagram:
+        lines += ["## Architecture Diagram", "", "```mermaid", content.architecture_diagram, "```", ""]
+
+    lines += ["## Key Concepts", ""]
+    for concept in content.key_concepts.concepts:
+        lines += [f"### {concept.name}", "", f"- **What**: {concept.what}", f"- **Why**: {concept.why}"]
+        if concept.config_rationale:
+            lines.append(f"- **설정값 선택 이유**: {concept.config_rationale}")
+        lines += [f"- **Docs**: {url}" for url in concept.official_docs]
+        lines.append("")
+
+    lines += [
+        "## Hands-on Part 1: Console Lab",
+        "",
+        f"[{CONSOLE_DIRNAME}/README.md]({CONSOLE_DIRNAME}/README.md) (예상 소요 시간: {content.console_lab.estimated_time}분)",
+        "",
+        "## Hands-on Part 2: CDK Lab",
+        "",
+        f"[{CDK_DIRNAME}/README.md]({CDK_DIRNAME}/README.md) (예상 소요 시간: {content.cdk_lab.estimated_time}분)",
+        "",
+    ]
+
+    lines += ["## Verification", ""] + _bullets(content.verification.objectives)
+    for case in content.verification.test_cases:
+        lines.append(f"- `{case.name}`: {case.description}")
+    lines.append("")
+
+    lines += ["## Daily Quiz", ""]
+    for question in content.quiz.questions:
+        lines += [f"**Q{question.question_number}.** {question.question_text}", ""]
+        lines += _bullets(question.options) + [""]
+        lines += [
+            "<details><summary>정답 및 해설</summary>",
+            "",
+            f"정답: {question.correct_answer}",
+            "",
+            question.explanation,
+            "",
+            "</details>",
+            "",
+        ]
+
+    return "\n".join(lines)
+
+
+def render_console_lab(lab: ConsoleLabContent) -> str:
+    """콘솔 실습 가이드 렌더링"""
+    lines = ["# Part 1: Console Lab", "", "## 실습 목표", ""] + _bullets(lab.objectives) + [""]
+
+    lines += ["## 실습 절차", ""]
+    for procedure in lab.procedures:
+        lines += [f"### Step {procedure.step_number}. {procedure.title}", ""]
+        lines += [f"{index}. {text}" for index, text in enumerate(procedure.instructions, start=1)]
+        lines.append("")
+        if procedure.expected_outcome:
+            lines += [f"**예상 결과**: {procedure.expected_outcome}", ""]
+        if procedure.troubleshooting:
+            lines += ["**문제 해결**", ""] + _bullets(procedure.troubleshooting) + [""]
+
+    lines += ["## 리소스 정리", ""]
+    for step in sorted(lab.cleanup_steps, key=lambda s: s.deletion_order):
+        lines += [f"### {step.deletion_order}. {step.resource_type}", ""]
+        lines += _bullets(step.instructions)
+        if step.verification:
+            lines.append(f"- 확인: {step.verification}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def render_cdk_lab(lab: CdkLabContent) -> str:
+    """CDK 실습 가이드 렌더링"""
+    fence = "typescript" if lab.language == "typescript" else "python"
+    lines = [
+        "# Part 2: CDK Lab",
+        "",
+        f"- 언어: {lab.language}",
+        f"- 인스턴스 타입: {lab.instance_type}",
+        f"- 삭제 정책: {lab.cleanup_config.removal_policy}",
+        f"- 객체 자동 삭제: {str(lab.cleanup_config.auto_delete_objects).lower()}",
+        "",
+    ]
+    if lab.security_group_rules:
+        lines += ["## Security Group 규칙", ""]
+        for rule in lab.security_group_rules:
+            lines.append(f"- {rule.protocol}/{rule.port} from {rule.source} {rule.description}".rstrip())
+        lines.append("")
+    if lab.stack_code:
+        lines += ["## Stack 코드", "", f"```{fence}", lab.stack_code, "```", ""]
+
+    pipeline = lab.cicd_pipeline
+    if pipeline.github_actions_workflow:
+        lines += ["## GitHub Actions", "", "```yaml", pipeline.github_actions_workflow, "```", ""]
+    if pipeline.dockerfile:
+        lines += ["## Dockerfile", "", "```dockerfile", pipeline.dockerfile, "```", ""]
+
+    return "\n".join(lines)
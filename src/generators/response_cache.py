@@ -0,0 +1,314 @@
+"""
+콘텐츠 소스 응답 캐시
+
+메모리 LRU와 SQLite 디스크 저장소로 구성된 2단계 캐시입니다.
+키는 ContentRequest의 정규화된 요청(주제, AWS 서비스, 난이도, 섹션 관련
+설정값, 프롬프트 버전)이므로, 설정 일부를 바꿔 다시 생성해도 영향을 받지
+않는 섹션은 캐시에서 바로 가져옵니다. ContentSourceClient는 여기에 응답을
+만든 소스와 데이터 버전(ContentSource.cache_namespace)을 더한 키를 넘기므로,
+소스를 바꾸거나 콘텐츠 팩 파일을 수정하면 이전 응답은 적중하지 않습니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from .content_source import ContentRequest
+
+
+class CacheStats(BaseModel):
+    """캐시 적중 통계"""
+
+    memory_hits: int = Field(default=0, ge=0, description="메모리 적중 수")
+    disk_hits: int = Field(default=0, ge=0, description="디스크 적중 수")
+    misses: int = Field(default=0, ge=0, description="미적중 수")
+    evictions: int = Field(default=0, ge=0, description="크기/TTL로 제거된 항목 수")
+    errors: int = Field(default=0, ge=0, description="저장소 오류로 건너뛴 캐시 작업 수")
+
+    @property
+    def hits(self) -> int:
+        """전체 적중 수"""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (0.0-1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _MemoryEntry:
+    """메모리 캐시 항목"""
+
+    __slots__ = ("payload", "created_at", "section", "days")
+
+    def __init__(self, payload: str, created_at: float, section: str, days: Set[int]):
+        self.payload = payload
+        self.created_at = created_at
+        self.section = section
+        self.days = days
+
+
+class ResponseCache:
+    """
+    2단계 응답 캐시
+
+    여러 스레드에서 호출해도 안전합니다. 디스크 조회/기록은 잠금 대기로
+    블로킹될 수 있으므로 ContentSourceClient는 이를 스레드에서 실행하며,
+    캐시는 스레드마다 별도 SQLite 연결을 사용합니다.
+
+    Args:
+        db_path: SQLite 파일 경로 (None이면 메모리 캐시만 사용)
+        max_memory_entries: 메모리 LRU 최대 항목 수
+        max_disk_entries: 디스크 저장소 최대 항목 수 (최근 사용 순으로 유지)
+        ttl_seconds: 항목 유효 시간 (None이면 만료 없음)
+        clock: 현재 시각 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_memory_entries: int = 512,
+        max_disk_entries: int = 50000,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_memory_entries < 1 or max_disk_entries < 1:
+            raise ValueError("캐시 최대 항목 수는 1 이상이어야 합니다")
+
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        # 메모리 LRU와 통계를 보호하는 잠금 (디스크 작업 중에는 잡지 않음)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            # 여러 호스트가 공유 파일시스템에서 같은 캐시 파일을 쓸 수 있으므로 WAL이
+            # 아닌 기본 롤백 저널을 사용합니다 (이전에 WAL로 만든 파일도 되돌림).
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    section TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+                CREATE TABLE IF NOT EXISTS response_days (
+                    key TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    PRIMARY KEY (key, day)
+                );
+                CREATE INDEX IF NOT EXISTS idx_response_days_day ON response_days (day);
+                """
+            )
+            self._conn.commit()
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # 스레드마다 별도 연결을 사용하여, 한 스레드의 잠금 대기나 트랜잭션이
+        # 다른 스레드의 캐시 호출과 섞이지 않게 합니다.
+        assert self.db_path is not None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and self.clock() - created_at > self.ttl_seconds
+
+    def get(self, request: ContentRequest, key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답을 조회합니다.
+
+        Args:
+            request: 섹션 콘텐츠 요청
+            key: 캐시 키 (기본값: request.key())
+
+        Returns:
+            캐시된 섹션 콘텐츠, 없거나 만료되었으면 None
+        """
+        key = key or request.key()
+        day = request.global_day_number
+
+        with self._lock:
+            entry = self._memory.get(key)
+            expired = entry is not None and self._expired(entry.created_at)
+            new_day = False
+            if entry is not None and not expired:
+                self._memory.move_to_end(key)
+                new_day = day not in entry.days
+                entry.days.add(day)
+                self.stats.memory_hits += 1
+
+        if entry is not None:
+            if expired:
+                self._evict(key)
+            else:
+                if new_day:
+                    self._link_day(key, day)
+                return json.loads(entry.payload)
+
+        row = self._disk_get(key)
+        if row is not None:
+            payload, created_at, section = row
+            if self._expired(created_at):
+                self._evict(key)
+            else:
+                self._touch(key, day)
+                with self._lock:
+                    self._remember(key, _MemoryEntry(payload, created_at, section, {day}))
+                    self.stats.disk_hits += 1
+                return json.loads(payload)
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def put(self, request: ContentRequest, payload: Dict[str, Any], key: Optional[str] = None) -> None:
+        """응답을 두 단계 모두에 저장합니다."""
+        key = key or request.key()
+        day = request.global_day_number
+        encoded = json.dumps(payload, ensure_ascii=False)
+        now = self.clock()
+
+        with self._lock:
+            self._remember(key, _MemoryEntry(encoded, now, request.section, {day}))
+
+        if self.db_path is not None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, section, payload, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, request.section, encoded, now, now),
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO response_days (key, day) VALUES (?, ?)", (key, day)
+                )
+            self._evict_disk()
+
+    def invalidate(self, day: Optional[int] = None, section: Optional[str] = None) -> int:
+        """
+        일차 및/또는 섹션 기준으로 캐시 항목을 무효화합니다.
+
+        둘 다 None이면 전체를 비웁니다.
+
+        Returns:
+            무효화된 항목 수
+        """
+        with self._lock:
+            keys = {
+                key
+                for key, entry in self._memory.items()
+                if (day is None or day in entry.days) and (section is None or entry.section == section)
+            }
+
+        if self.db_path is not None:
+            query = "SELECT r.key FROM responses r"
+            conditions: List[str] = []
+            params: List[Any] = []
+            if day is not None:
+                query += " JOIN response_days d ON d.key = r.key"
+                conditions.append("d.day = ?")
+                params.append(day)
+            if section is not None:
+                conditions.append("r.section = ?")
+                params.append(section)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            keys.update(row[0] for row in self._conn.execute(query, params))
+
+        return sum(1 for key in keys if self._discard(key))
+
+    def clear(self) -> None:
+        """전체 캐시를 비웁니다."""
+        self.invalidate()
+
+    def close(self) -> None:
+        """모든 스레드의 SQLite 연결을 닫습니다 (이후에는 메모리 캐시만 사용)."""
+        self.db_path = None
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _remember(self, key: str, entry: _MemoryEntry) -> None:
+        # self._lock을 잡은 상태에서 호출합니다.
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            # 디스크 저장소가 있으면 항목이 그대로 남아 있으므로 제거로 세지 않습니다.
+            if self.db_path is None:
+                self.stats.evictions += 1
+
+    def _disk_get(self, key: str) -> Optional[Tuple[str, float, str]]:
+        if self.db_path is None:
+            return None
+        return self._conn.execute(
+            "SELECT payload, created_at, section FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _touch(self, key: str, day: int) -> None:
+        """디스크 적중 시 최근 사용 시각과 일차 연결을 한 트랜잭션으로 기록"""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (self.clock(), key)
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO response_days (key, day) VALUES (?, ?)", (key, day)
+            )
+
+    def _link_day(self, key: str, day: int) -> None:
+        if self.db_path is not None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO response_days (key, day) VALUES (?, ?)", (key, day)
+                )
+
+    def _discard(self, key: str) -> bool:
+        with self._lock:
+            removed = self._memory.pop(key, None) is not None
+        if self.db_path is not None:
+            with self._conn:
+                cursor = self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.execute("DELETE FROM response_days WHERE key = ?", (key,))
+            removed = cursor.rowcount > 0 or removed
+        return removed
+
+    def _evict(self, key: str) -> None:
+        if self._discard(key):
+            with self._lock:
+                self.stats.evictions += 1
+
+    def _evict_disk(self) -> None:
+        with self._conn:
+            stale = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?",
+                    (self.max_disk_entries,),
+                )
+            ]
+        for key in stale:
+            self._evict(key)
@@ -0,0 +1,189 @@
+"""
+실러버스 및 색인 렌더링
+
+실러버스의 일차를 하나씩 순회하면서 생성된 DailyContent를 함께 읽어,
+한 번의 순회로 다음 파일을 기록합니다.
+
+- `syllabus.md`: 30일 실러버스 (주차별 일차 주제, 서비스, 학습 목표, 시간)
+- `service_index.md`: AWS 서비스별로 다루는 일차 목록
+- `search_index.json`: 일차별 검색 색인
+
+DailyContent는 일차마다 읽고 바로 버리므로, 전체 콘텐츠를 메모리에
+올리지 않고도 대형 실러버스를 렌더링할 수 있습니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..models.daily_content import DailyContent
+from ..models.syllabus import DayOverview, Syllabus, Week
+from .output_writer import content_path, load_daily_content
+
+
+SYLLABUS_FILENAME = "syllabus.md"
+SERVICE_INDEX_FILENAME = "service_index.md"
+SEARCH_INDEX_FILENAME = "search_index.json"
+
+DIFFICULTY_LABELS = {
+    "beginner": "초급",
+    "intermediate": "중급",
+    "advanced": "고급",
+}
+
+
+class SyllabusOutputs(BaseModel):
+    """렌더링 결과 파일 경로"""
+
+    syllabus: str = Field(..., description="syllabus.md 경로")
+    service_index: str = Field(..., description="service_index.md 경로")
+    search_index: str = Field(..., description="search_index.json 경로")
+    days: int = Field(default=0, ge=0, description="렌더링한 일차 수")
+    days_with_content: int = Field(default=0, ge=0, description="생성된 콘텐츠가 있는 일차 수")
+
+
+def iter_generated_days(
+    syllabus: Syllabus,
+    output_directory: str,
+) -> Iterator[Tuple[Week, DayOverview, Optional[DailyContent]]]:
+    """
+    실러버스 일차와 생성된 콘텐츠를 하나씩 반환합니다.
+
+    아직 생성되지 않았거나 읽을 수 없는 일차의 콘텐츠는 None입니다.
+    """
+    for week, day in syllabus.iter_days():
+        path = content_path(output_directory, week.week_number, day.global_day_number)
+        content = None
+        if path.exists():
+            try:
+                content = load_daily_content(path)
+            except ValueError:
+                content = None
+        yield week, day, content
+
+
+class _AtomicWriter:
+    """임시 파일에 기록한 뒤 완료 시 교체하는 텍스트 파일"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.temp_path = path.with_name(path.name + ".tmp")
+        self.file: Optional[TextIO] = None
+
+    def __enter__(self) -> TextIO:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.temp_path, "w", encoding="utf-8")
+        return self.file
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        assert self.file is not None
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.temp_path, self.path)
+        else:
+            self.temp_path.unlink(missing_ok=True)
+
+
+def _day_link(week: Week, day: DayOverview) -> str:
+    return f"week{week.week_number}/day{day.global_day_number}/README.md"
+
+
+def _write_day(out: TextIO, week: Week, day: DayOverview, content: Optional[DailyContent]) -> None:
+    difficulty = DIFFICULTY_LABELS.get(day.difficulty, day.difficulty)
+    out.write(f"### Day {day.global_day_number}: {day.topic}\n\n")
+    out.write(f"- AWS 서비스: {', '.join(day.aws_services) or '-'}\n")
+    out.write(f"- 난이도: {difficulty}\n")
+    out.write(f"- 예상 학습 시간: {day.estimated_hours}시간\n")
+
+    if content is None:
+        out.write("- 콘텐츠: 미생성\n\n")
+        return
+
+    lab_minutes = content.console_lab.estimated_time + content.cdk_lab.estimated_time
+    out.write(f"- 실습 시간: 콘솔 {content.console_lab.estimated_time}분 + CDK {content.cdk_lab.estimated_time}분 ")
+    out.write(f"(총 {lab_minutes}분)\n")
+    out.write(f"- 상세 가이드: [{_day_link(week, day)}]({_day_link(week, day)})\n")
+    if content.overview.learning_objectives:
+        out.write("\n**학습 목표**\n\n")
+        for objective in content.overview.learning_objectives:
+            out.write(f"- {objective}\n")
+    out.write("\n")
+
+
+def _search_entry(week: Week, day: DayOverview, content: Optional[DailyContent]) -> Dict:
+    entry = {
+        "week": week.week_number,
+        "day": day.global_day_number,
+        "topic": day.topic,
+        "aws_services": day.aws_services,
+        "difficulty": day.difficulty,
+        "estimated_hours": day.estimated_hours,
+        "path": f"week{week.week_number}/day{day.global_day_number}",
+        "generated": content is not None,
+    }
+    if content is not None:
+        entry["description"] = content.overview.description
+        entry["learning_objectives"] = content.overview.learning_objectives
+        entry["concepts"] = [concept.name for concept in content.key_concepts.concepts]
+    return entry
+
+
+def render_syllabus_outputs(syllabus: Syllabus, output_directory: str) -> SyllabusOutputs:
+    """
+    syllabus.md, 서비스 색인, 검색 색인을 한 번의 순회로 기록합니다.
+
+    Args:
+        syllabus: 실러버스
+        output_directory: 생성된 커리큘럼 출력 디렉토리
+
+    Returns:
+        기록한 파일 경로와 일차 수
+    """
+    root = Path(output_directory)
+    outputs = SyllabusOutputs(
+        syllabus=str(root / SYLLABUS_FILENAME),
+        service_index=str(root / SERVICE_INDEX_FILENAME),
+        search_index=str(root / SEARCH_INDEX_FILENAME),
+    )
+    # 서비스 → [(일차, 주제, 링크)] (일차 개요 수준의 작은 데이터만 누적)
+    services: Dict[str, List[Tuple[int, str, str]]] = {}
+    metadata = syllabus.metadata
+
+    with _AtomicWriter(Path(outputs.syllabus)) as md, _AtomicWriter(Path(outputs.search_index)) as index:
+        md.write(f"# AWS {metadata.target_exam} {metadata.total_days}일 커리큘럼 실러버스\n\n")
+        index.write("[\n")
+
+        current_week: Optional[int] = None
+        for week, day, content in iter_generated_days(syllabus, output_directory):
+            if week.week_number != current_week:
+                current_week = week.week_number
+                md.write(f"## Week {week.week_number}: {week.theme}\n\n{week.description}\n\n")
+
+            _write_day(md, week, day, content)
+
+            if outputs.days:
+                index.write(",\n")
+            index.write("  " + json.dumps(_search_entry(week, day, content), ensure_ascii=False))
+
+            for service in day.aws_services:
+                services.setdefault(service, []).append(
+                    (day.global_day_number, day.topic, _day_link(week, day))
+                )
+            outputs.days += 1
+            if content is not None:
+                outputs.days_with_content += 1
+
+        index.write("\n]\n")
+
+    with _AtomicWriter(Path(outputs.service_index)) as out:
+        out.write("# AWS 서비스별 학습 일차\n\n")
+        for service in sorted(services, key=str.lower):
+            out.write(f"## {service}\n\n")
+            for global_day, topic, link in services[service]:
+                out.write(f"- [Day {global_day}: {topic}]({link})\n")
+            out.write("\n")
+
+    return outputs
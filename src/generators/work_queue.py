@@ -0,0 +1,415 @@
+"""
+분산 생성 작업 큐
+
+코디네이터가 (커리큘럼, 일차) 작업 단위를 SQLite 큐에 나누어 넣고,
+여러 워커 프로세스/호스트가 임대(lease)를 걸어 단위를 가져가 생성합니다.
+결과는 커리큘럼 지문으로 주소가 정해지는 출력 트리
+(`{output_root}/{curriculum_id}/week{n}/day{n}/`)에 기록됩니다.
+
+임대가 만료된 단위(워커 중단 등)는 다른 워커가 다시 가져갈 수 있고,
+임대를 잃은 워커의 완료 보고는 무시되므로 같은 단위가 중복 기록되지 않습니다.
+SQLite 잠금에 의존하므로 큐 파일은 로컬 디스크나 잠금을 제대로 지원하는
+공유 파일시스템에 두어야 하며(네트워크 파일시스템에서도 동작하도록 WAL이
+아닌 롤백 저널 사용), 호스트 간 시계가 동기화되어 있어야 합니다.
+큐 호출은 잠금 대기로 블로킹될 수 있으므로 워커는 이를 스레드에서 실행하고,
+큐는 스레드마다 별도 SQLite 연결을 사용합니다.
+"""
+
+import asyncio
+import contextlib
+import os
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..models.config import CurriculumConfig
+from ..models.daily_content import DailyContent
+from ..models.syllabus import DayOverview, Syllabus
+from .content_source import ContentSourceClient
+from .daily_content_generator import DailyContentGenerator
+from .exceptions import ContentGenerationError
+from .orchestrator import syllabus_fingerprint
+from .output_writer import day_directory, render_daily_content, save_daily_content
+
+
+# 출력 디렉토리 이름으로 사용할 커리큘럼 지문 길이
+CURRICULUM_ID_LENGTH = 16
+
+STAGING_DIRNAME = ".staging"
+
+
+class WorkUnit(BaseModel):
+    """작업 단위 (커리큘럼의 한 일차)"""
+
+    curriculum_id: str = Field(..., min_length=1, description="커리큘럼 지문")
+    week_number: int = Field(..., ge=1, description="주차 번호")
+    day: int = Field(..., ge=1, description="전체 일차 번호")
+    attempts: int = Field(default=0, ge=0, description="임대 횟수")
+    lease_owner: str = Field(default="", description="임대한 워커 ID")
+
+
+def default_worker_id() -> str:
+    """호스트 이름, PID, 난수로 구성된 워커 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class WorkQueue:
+    """
+    SQLite 기반 임대 작업 큐
+
+    Args:
+        queue_path: 큐 SQLite 파일 경로
+        max_attempts: 단위별 최대 시도 횟수 (초과 시 failed로 격리)
+        clock: 현재 시각 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        queue_path: str,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.time,
+    ):
+        Path(queue_path).parent.mkdir(parents=True, exist_ok=True)
+        self.queue_path = queue_path
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # WAL은 네트워크 파일시스템에서 동작하지 않으므로 기본 롤백 저널을 사용합니다
+        # (이전에 WAL로 만든 큐 파일도 되돌림).
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS curricula (
+                curriculum_id TEXT PRIMARY KEY,
+                syllabus TEXT NOT NULL,
+                config TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS units (
+                curriculum_id TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                week_number INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                lease_owner TEXT NOT NULL DEFAULT '',
+                lease_expires REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                completed_by TEXT NOT NULL DEFAULT '',
+                error_section TEXT NOT NULL DEFAULT '',
+                error_details TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (curriculum_id, day)
+            );
+            CREATE INDEX IF NOT EXISTS idx_units_status ON units (status, lease_expires);
+            """
+        )
+        self._curricula: Dict[str, Tuple[Syllabus, CurriculumConfig]] = {}
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # 스레드마다 별도 연결을 사용하여, 한 스레드의 잠금 대기나 트랜잭션이
+        # 다른 스레드의 큐 호출과 섞이지 않게 합니다.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.queue_path,
+                timeout=60.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """모든 스레드의 SQLite 연결을 닫습니다."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        # 읽기-수정-쓰기를 원자적으로 처리하기 위해 즉시 쓰기 잠금을 잡습니다.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    def add_curriculum(self, syllabus: Syllabus, config: CurriculumConfig) -> str:
+        """
+        커리큘럼의 모든 일차를 작업 단위로 추가합니다.
+
+        같은 커리큘럼을 다시 추가해도 기존 단위는 그대로 유지됩니다.
+
+        Returns:
+            커리큘럼 ID (실러버스/설정 지문)
+        """
+        curriculum_id = syllabus_fingerprint(syllabus, config)[:CURRICULUM_ID_LENGTH]
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO curricula (curriculum_id, syllabus, config) VALUES (?, ?, ?)",
+                (curriculum_id, syllabus.model_dump_json(), config.model_dump_json()),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO units (curriculum_id, day, week_number) VALUES (?, ?, ?)",
+                [
+                    (curriculum_id, day.global_day_number, week.week_number)
+                    for week, day in syllabus.iter_days()
+                ],
+            )
+        return curriculum_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[WorkUnit]:
+        """
+        대기 중이거나 임대가 만료된 단위 하나를 임대합니다.
+
+        Returns:
+            임대한 작업 단위, 가져갈 단위가 없으면 None
+        """
+        now = self.clock()
+        with self._transaction() as conn:
+            # 임대 만료가 반복된 단위는 더 이상 나누어 주지 않고 격리합니다.
+            conn.execute(
+                "UPDATE units SET status = 'failed', lease_owner = '', error_section = 'lease', "
+                "error_details = '임대 만료 반복' "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = conn.execute(
+                "SELECT curriculum_id, day, week_number, attempts FROM units "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY attempts, curriculum_id, day LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            curriculum_id, day, week_number, attempts = row
+            conn.execute(
+                "UPDATE units SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE curriculum_id = ? AND day = ?",
+                (worker_id, now + lease_seconds, curriculum_id, day),
+            )
+        return WorkUnit(
+            curriculum_id=curriculum_id,
+            week_number=week_number,
+            day=day,
+            attempts=attempts + 1,
+            lease_owner=worker_id,
+        )
+
+    def _update_owned(self, unit: WorkUnit, assignments: str, params: Tuple) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE units SET {assignments} "
+                "WHERE curriculum_id = ? AND day = ? AND status = 'leased' "
+                "AND lease_owner = ? AND attempts = ?",
+                params + (unit.curriculum_id, unit.day, unit.lease_owner, unit.attempts),
+            )
+        return cursor.rowcount == 1
+
+    def renew(self, unit: WorkUnit, lease_seconds: float) -> bool:
+        """임대를 연장합니다. 임대를 잃었으면 False."""
+        return self._update_owned(unit, "lease_expires = ?", (self.clock() + lease_seconds,))
+
+    def complete(self, unit: WorkUnit) -> bool:
+        """단위 완료를 보고합니다. 임대를 잃었으면 False."""
+        return self._update_owned(unit, "status = 'done', completed_by = lease_owner", ())
+
+    def fail(self, unit: WorkUnit, error: ContentGenerationError) -> bool:
+        """
+        단위 실패를 보고합니다.
+
+        최대 시도 횟수 전에는 다시 대기 상태로, 이후에는 failed로 격리합니다.
+        """
+        status = "failed" if unit.attempts >= self.max_attempts else "pending"
+        return self._update_owned(
+            unit,
+            "status = ?, lease_owner = '', lease_expires = 0, error_section = ?, error_details = ?",
+            (status, error.section, error.details),
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 단위 수"""
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        for status, count in self._conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def has_unfinished(self) -> bool:
+        """대기 중이거나 임대 중인 단위가 있는지 여부"""
+        counts = self.counts()
+        return counts["pending"] + counts["leased"] > 0
+
+    def failed_units(self) -> List[Tuple[str, int, str, str]]:
+        """격리된 단위 목록 (curriculum_id, day, section, details)"""
+        return list(
+            self._conn.execute(
+                "SELECT curriculum_id, day, error_section, error_details FROM units "
+                "WHERE status = 'failed' ORDER BY curriculum_id, day"
+            )
+        )
+
+    def load_curriculum(self, curriculum_id: str) -> Tuple[Syllabus, CurriculumConfig]:
+        """커리큘럼의 실러버스와 설정 (프로세스 내 캐시)"""
+        if curriculum_id not in self._curricula:
+            row = self._conn.execute(
+                "SELECT syllabus, config FROM curricula WHERE curriculum_id = ?", (curriculum_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"큐에 없는 커리큘럼입니다: {curriculum_id}")
+            self._curricula[curriculum_id] = (
+                Syllabus.model_validate_json(row[0]),
+                CurriculumConfig.model_validate_json(row[1]),
+            )
+        return self._curricula[curriculum_id]
+
+
+def shard_curricula(
+    queue: WorkQueue,
+    curricula: Iterable[Tuple[Syllabus, CurriculumConfig]],
+) -> List[str]:
+    """코디네이터: 커리큘럼들을 (커리큘럼, 일차) 단위로 큐에 넣습니다."""
+    return [queue.add_curriculum(syllabus, config) for syllabus, config in curricula]
+
+
+class DistributedWorker:
+    """
+    분산 생성 워커
+
+    Args:
+        queue: 작업 큐
+        client: 콘텐츠 소스 클라이언트
+        output_root: 커리큘럼별 출력 트리의 루트 디렉토리
+        worker_id: 워커 ID (기본값: 호스트-PID-난수)
+        lease_seconds: 임대 시간 (생성 중에는 1/3 주기로 연장)
+        parallel_units: 워커 하나가 동시에 처리할 단위 수
+        poll_interval: 다른 워커의 임대 만료를 기다릴 때 폴링 간격
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        client: ContentSourceClient,
+        output_root: str,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 300.0,
+        parallel_units: int = 4,
+        poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        self.client = client
+        self.output_root = Path(output_root)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.parallel_units = parallel_units
+        self.poll_interval = poll_interval
+        self.completed = 0
+        self.failed = 0
+
+    def curriculum_directory(self, curriculum_id: str) -> Path:
+        """커리큘럼 출력 디렉토리"""
+        return self.output_root / curriculum_id
+
+    async def run(self) -> int:
+        """
+        큐가 빌 때까지 단위를 가져와 생성합니다.
+
+        Returns:
+            이 워커가 완료한 단위 수
+        """
+        await asyncio.gather(*(self._loop() for _ in range(self.parallel_units)))
+        return self.completed
+
+    async def _loop(self) -> None:
+        # 큐 호출은 잠금 대기로 블로킹될 수 있으므로 이벤트 루프 밖에서 실행합니다.
+        while True:
+            unit = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds)
+            if unit is None:
+                if not await asyncio.to_thread(self.queue.has_unfinished):
+                    return
+                await asyncio.sleep(self.poll_interval)
+                continue
+            await self.process(unit)
+
+    async def process(self, unit: WorkUnit) -> bool:
+        """단위 하나를 생성하고 결과를 보고합니다."""
+        heartbeat = asyncio.ensure_future(self._heartbeat(unit))
+        try:
+            await self._generate(unit)
+        except ContentGenerationError as e:
+            return await self._fail(unit, e)
+        except OSError as e:
+            return await self._fail(unit, ContentGenerationError(unit.day, "write", str(e)))
+        except sqlite3.Error as e:
+            # 공유 응답 캐시/큐 잠금 오류 등은 이 단위의 실패로 보고하고 워커는 계속 진행
+            return await self._fail(unit, ContentGenerationError(unit.day, "sqlite", str(e)))
+        except Exception as e:
+            return await self._fail(unit, ContentGenerationError(unit.day, "generate", repr(e)))
+        finally:
+            heartbeat.cancel()
+
+        if await asyncio.to_thread(self.queue.complete, unit):
+            self.completed += 1
+            return True
+        return False
+
+    async def _fail(self, unit: WorkUnit, error: ContentGenerationError) -> bool:
+        await asyncio.to_thread(self.queue.fail, unit, error)
+        self.failed += 1
+        return False
+
+    async def _heartbeat(self, unit: WorkUnit) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not await asyncio.to_thread(self.queue.renew, unit, self.lease_seconds):
+                return
+
+    def _find_day(self, syllabus: Syllabus, unit: WorkUnit) -> DayOverview:
+        day = syllabus.get_day_by_global_number(unit.day)
+        if day is None:
+            raise ContentGenerationError(unit.day, "syllabus", "실러버스에 없는 일차입니다")
+        return day
+
+    async def _generate(self, unit: WorkUnit) -> None:
+        syllabus, config = await asyncio.to_thread(self.queue.load_curriculum, unit.curriculum_id)
+        curriculum_directory = self.curriculum_directory(unit.curriculum_id)
+        final = day_directory(str(curriculum_directory), unit.week_number, unit.day)
+        if final.exists():
+            # 임대가 만료되기 전에 이전 워커가 이미 기록을 마친 경우
+            return
+
+        generator = DailyContentGenerator(self.client, config)
+        content = await generator.generate_daily_content(unit.week_number, self._find_day(syllabus, unit))
+        await asyncio.to_thread(self._write, content, unit, final)
+
+    def _write(self, content: DailyContent, unit: WorkUnit, final: Path) -> None:
+        # 스테이징 디렉토리에 먼저 쓰고 rename으로 옮겨 부분 기록이 보이지 않게 합니다.
+        staging = (
+            self.output_root / STAGING_DIRNAME / f"{unit.curriculum_id}-day{unit.day}-{self.worker_id}"
+        )
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            save_daily_content(content, str(staging))
+            render_daily_content(content, str(staging))
+            final.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(day_directory(str(staging), unit.week_number, unit.day), final)
+            except OSError:
+                if not final.exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
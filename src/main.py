@@ -0,0 +1,343 @@
+"""
+커리큘럼 생성 CLI
+
+사용법:
+    python -m src.main generate-syllabus --syllabus syllabus.yaml
+    python -m src.main generate-all --syllabus syllabus.yaml [--resume]
+    python -m src.main enqueue --queue queue.sqlite3 --curriculum config.yaml syllabus.yaml
+    python -m src.main worker --queue queue.sqlite3 --output output/
+    python -m src.main queue-status --queue queue.sqlite3
+    python -m src.main invalidate-cache [--day 3] [--section quiz]
+    python -m src.main audit --curriculum config.yaml syllabus.yaml [output/]
+    python -m src.main export --archive curriculum.tar.zst
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .generators import (
+    SECTIONS,
+    CacheStats,
+    CheckpointMismatchError,
+    ContentSource,
+    ContentSourceClient,
+    DailyContentGenerator,
+    DistributedWorker,
+    GenerationOrchestrator,
+    LocalContentPackSource,
+    ResponseCache,
+    StubContentSource,
+    WorkQueue,
+    export_archive,
+    iter_daily_content,
+    render_syllabus_outputs,
+    shard_curricula,
+)
+from .utils import load_config, load_syllabus
+from .validators import ColumnBuilder, PropertyCheckEngine
+
+
+# 출력 디렉토리 기준 응답 캐시 위치 (새로 실행해도 유지됩니다)
+CACHE_PATH = Path(".cache") / "responses.sqlite3"
+
+
+def build_source(content_pack: Optional[str]) -> ContentSource:
+    """콘텐츠 팩이 지정되면 로컬 팩, 아니면 스텁 소스"""
+    if content_pack:
+        return LocalContentPackSource(content_pack)
+    return StubContentSource()
+
+
+def build_client(output_directory: str, args: argparse.Namespace) -> ContentSourceClient:
+    """CLI 옵션으로 콘텐츠 소스 클라이언트 구성"""
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(str(Path(output_directory) / CACHE_PATH))
+    return ContentSourceClient(
+        build_source(args.content_pack),
+        max_concurrency=args.max_concurrency,
+        cache=cache,
+    )
+
+
+def close_client(client: ContentSourceClient) -> None:
+    """응답 캐시 통계를 출력하고 연결 정리"""
+    if client.cache is not None:
+        print(_format_cache_stats(client.cache.stats))
+        client.cache.close()
+
+
+def _format_cache_stats(stats: CacheStats) -> str:
+    message = (
+        f"응답 캐시: 적중 {stats.hits}회 (메모리 {stats.memory_hits}, 디스크 {stats.disk_hits}), "
+        f"미적중 {stats.misses}회, 적중률 {stats.hit_rate:.1%}, 제거 {stats.evictions}개"
+    )
+    if stats.errors:
+        message += f", 저장소 오류 {stats.errors}회"
+    return message
+
+
+def cmd_generate_syllabus(args: argparse.Namespace) -> int:
+    """generate-syllabus: syllabus.md와 서비스/검색 색인 생성"""
+    config = load_config(args.config)
+    syllabus = load_syllabus(args.syllabus)
+    output_directory = args.output or config.output_directory
+
+    outputs = render_syllabus_outputs(syllabus, output_directory)
+    print(f"실러버스: {outputs.syllabus} ({outputs.days}일, 콘텐츠 생성 {outputs.days_with_content}일)")
+    print(f"서비스 색인: {outputs.service_index}")
+    print(f"검색 색인: {outputs.search_index}")
+    return 0
+
+
+def cmd_generate_all(args: argparse.Namespace) -> int:
+    """generate-all: 전체 커리큘럼 생성"""
+    config = load_config(args.config)
+    syllabus = load_syllabus(args.syllabus)
+    output_directory = args.output or config.output_directory
+
+    generator = DailyContentGenerator(build_client(output_directory, args), config)
+    orchestrator = GenerationOrchestrator(generator, output_directory, chunk_size=args.chunk_size)
+
+    try:
+        report = asyncio.run(orchestrator.run(syllabus, resume=args.resume))
+    except CheckpointMismatchError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    finally:
+        close_client(generator.client)
+
+    render_syllabus_outputs(syllabus, output_directory)
+    print(
+        f"생성 완료: {len(report.generated)}일, "
+        f"건너뜀: {len(report.skipped)}일, 실패: {len(report.failed)}일"
+    )
+    for unit in report.failed:
+        print(f"  Day {unit.day} - {unit.section} ({unit.stage}): {unit.details}", file=sys.stderr)
+    if report.failed:
+        print("실패한 일차만 다시 생성하려면 --resume 옵션으로 다시 실행하세요.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_invalidate_cache(args: argparse.Namespace) -> int:
+    """invalidate-cache: 일차/섹션 기준으로 응답 캐시 무효화"""
+    config = load_config(args.config)
+    output_directory = args.output or config.output_directory
+    cache_path = Path(output_directory) / CACHE_PATH
+    if not cache_path.exists():
+        print(f"응답 캐시가 없습니다: {cache_path}")
+        return 0
+
+    cache = ResponseCache(str(cache_path))
+    try:
+        removed = cache.invalidate(day=args.day, section=args.section)
+    finally:
+        cache.close()
+    print(f"응답 캐시 {removed}개 항목을 무효화했습니다: {cache_path}")
+    return 0
+
+
+def cmd_enqueue(args: argparse.Namespace) -> int:
+    """enqueue: 커리큘럼들을 (커리큘럼, 일차) 단위로 작업 큐에 추가"""
+    queue = WorkQueue(args.queue)
+    try:
+        curricula = [
+            (load_syllabus(syllabus_path), load_config(config_path))
+            for config_path, syllabus_path in args.curriculum
+        ]
+        for curriculum_id, (config_path, syllabus_path) in zip(
+            shard_curricula(queue, curricula), args.curriculum
+        ):
+            print(f"{curriculum_id}: {config_path} + {syllabus_path}")
+        print(_format_counts(queue.counts()))
+    finally:
+        queue.close()
+    return 0
+
+
+def cmd_worker(args: argparse.Namespace) -> int:
+    """worker: 큐가 빌 때까지 작업 단위를 가져와 생성"""
+    queue = WorkQueue(args.queue, max_attempts=args.max_attempts)
+    client = build_client(args.output, args)
+    worker = DistributedWorker(
+        queue,
+        client,
+        args.output,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+        parallel_units=args.parallel_units,
+    )
+    try:
+        completed = asyncio.run(worker.run())
+    finally:
+        close_client(client)
+        queue.close()
+
+    print(f"워커 {worker.worker_id}: 완료 {completed}개, 실패 {worker.failed}개")
+    return 1 if worker.failed else 0
+
+
+def cmd_queue_status(args: argparse.Namespace) -> int:
+    """queue-status: 작업 큐 상태 출력"""
+    queue = WorkQueue(args.queue)
+    try:
+        print(_format_counts(queue.counts()))
+        failed = queue.failed_units()
+    finally:
+        queue.close()
+
+    for curriculum_id, day, section, details in failed:
+        print(f"  {curriculum_id} Day {day} - {section}: {details}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_audit(args: argparse.Namespace) -> int:
+    """audit: 여러 커리큘럼의 정확성 속성을 한 번에 검증"""
+    builder = ColumnBuilder()
+    for values in args.curriculum:
+        if len(values) not in (2, 3):
+            print("--curriculum에는 CONFIG SYLLABUS [OUTPUT]을 지정하세요.", file=sys.stderr)
+            return 2
+        config_path, syllabus_path = values[:2]
+        contents = iter_daily_content(values[2]) if len(values) == 3 else None
+        try:
+            builder.add(load_syllabus(syllabus_path), load_config(config_path), contents)
+        except ValueError as e:
+            print(f"{syllabus_path}: {e}", file=sys.stderr)
+            return 2
+
+    results = PropertyCheckEngine().run(builder.build())
+    for result in results:
+        status = "통과" if result.passed else f"위반 (커리큘럼 {len(result.violating_curricula)}개)"
+        print(f"Property {result.property_id} {result.name}: {status}")
+        for index, day in result.violating_days[: args.max_details]:
+            print(f"  {args.curriculum[index][1]} Day {day}", file=sys.stderr)
+    return 0 if all(result.passed for result in results) else 1
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """export: 출력 트리를 .tar.zst 또는 .zip 아카이브로 내보내기"""
+    config = load_config(args.config)
+    output_directory = args.output or config.output_directory
+
+    try:
+        summary = export_archive(
+            output_directory,
+            args.archive,
+            workers=args.workers,
+            level=args.level,
+            include_content=args.include_content,
+        )
+    except (ValueError, ImportError) as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+    print(
+        f"아카이브: {summary.path} ({summary.format}, 파일 {summary.files}개, "
+        f"{summary.raw_bytes:,} → {summary.archive_bytes:,} bytes, {summary.ratio:.1%})"
+    )
+    return 0
+
+
+def _format_counts(counts: Dict[str, int]) -> str:
+    return (
+        f"대기: {counts['pending']}, 진행 중: {counts['leased']}, "
+        f"완료: {counts['done']}, 실패: {counts['failed']}"
+    )
+
+
+def _add_source_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--content-pack", default=None, help="로컬 콘텐츠 팩 디렉토리")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="콘텐츠 소스 동시 요청 수")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시 사용 안 함")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서"""
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="AWS SAA-C03 커리큘럼 생성")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_syllabus = subparsers.add_parser("generate-syllabus", help="실러버스 및 색인 생성")
+    generate_syllabus.add_argument("--config", default=None, help="설정 파일 경로 (기본값: config.yaml)")
+    generate_syllabus.add_argument("--syllabus", required=True, help="실러버스 파일 경로 (.yaml/.json)")
+    generate_syllabus.add_argument("--output", default=None, help="출력 디렉토리 (기본값: 설정의 output_directory)")
+    generate_syllabus.set_defaults(handler=cmd_generate_syllabus)
+
+    generate_all = subparsers.add_parser("generate-all", help="전체 커리큘럼 생성")
+    generate_all.add_argument("--config", default=None, help="설정 파일 경로 (기본값: config.yaml)")
+    generate_all.add_argument("--syllabus", required=True, help="실러버스 파일 경로 (.yaml/.json)")
+    generate_all.add_argument("--output", default=None, help="출력 디렉토리 (기본값: 설정의 output_directory)")
+    _add_source_arguments(generate_all)
+    generate_all.add_argument("--chunk-size", type=int, default=7, help="동시에 진행할 최대 일차 수")
+    generate_all.add_argument("--resume", action="store_true", help="마지막 체크포인트부터 재개")
+    generate_all.set_defaults(handler=cmd_generate_all)
+
+    invalidate_cache = subparsers.add_parser("invalidate-cache", help="응답 캐시 무효화 (기본값: 전체)")
+    invalidate_cache.add_argument("--config", default=None, help="설정 파일 경로 (기본값: config.yaml)")
+    invalidate_cache.add_argument("--output", default=None, help="출력 디렉토리 (기본값: 설정의 output_directory)")
+    invalidate_cache.add_argument("--day", type=int, default=None, help="무효화할 전체 일차 번호")
+    invalidate_cache.add_argument("--section", choices=SECTIONS, default=None, help="무효화할 섹션")
+    invalidate_cache.set_defaults(handler=cmd_invalidate_cache)
+
+    enqueue = subparsers.add_parser("enqueue", help="분산 생성: 커리큘럼을 작업 큐에 추가")
+    enqueue.add_argument("--queue", required=True, help="작업 큐 SQLite 파일 경로")
+    enqueue.add_argument(
+        "--curriculum",
+        nargs=2,
+        action="append",
+        required=True,
+        metavar=("CONFIG", "SYLLABUS"),
+        help="설정 파일과 실러버스 파일 (여러 번 지정 가능)",
+    )
+    enqueue.set_defaults(handler=cmd_enqueue)
+
+    worker = subparsers.add_parser("worker", help="분산 생성: 작업 큐의 단위를 생성")
+    worker.add_argument("--queue", required=True, help="작업 큐 SQLite 파일 경로")
+    worker.add_argument("--output", required=True, help="커리큘럼별 출력 트리의 루트 디렉토리")
+    worker.add_argument("--worker-id", default=None, help="워커 ID (기본값: 호스트-PID-난수)")
+    worker.add_argument("--lease-seconds", type=float, default=300.0, help="작업 단위 임대 시간 (초)")
+    worker.add_argument("--parallel-units", type=int, default=4, help="동시에 처리할 단위 수")
+    worker.add_argument("--max-attempts", type=int, default=3, help="단위별 최대 시도 횟수")
+    _add_source_arguments(worker)
+    worker.set_defaults(handler=cmd_worker)
+
+    queue_status = subparsers.add_parser("queue-status", help="분산 생성: 작업 큐 상태 출력")
+    queue_status.add_argument("--queue", required=True, help="작업 큐 SQLite 파일 경로")
+    queue_status.set_defaults(handler=cmd_queue_status)
+
+    audit = subparsers.add_parser("audit", help="정확성 속성 배치 검증")
+    audit.add_argument(
+        "--curriculum",
+        nargs="+",
+        action="append",
+        required=True,
+        metavar="CONFIG SYLLABUS [OUTPUT]",
+        help="설정 파일, 실러버스 파일, 생성된 출력 디렉토리 (여러 번 지정 가능)",
+    )
+    audit.add_argument("--max-details", type=int, default=20, help="속성별로 출력할 위반 일차 수")
+    audit.set_defaults(handler=cmd_audit)
+
+    export = subparsers.add_parser("export", help="출력 트리를 아카이브로 내보내기")
+    export.add_argument("--config", default=None, help="설정 파일 경로 (기본값: config.yaml)")
+    export.add_argument("--output", default=None, help="출력 디렉토리 (기본값: 설정의 output_directory)")
+    export.add_argument("--archive", required=True, help="아카이브 경로 (.tar.zst 또는 .zip)")
+    export.add_argument("--workers", type=int, default=None, help="압축 스레드 수 (기본값: CPU 수)")
+    export.add_argument("--level", type=int, default=None, help="압축 수준 (기본값: tar.zst 10, zip 6)")
+    export.add_argument("--include-content", action="store_true", help="content.json 포함")
+    export.set_defaults(handler=cmd_export)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 진입점"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
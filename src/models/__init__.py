@@ -4,9 +4,10 @@
 AWS SAA-C03 30일 커리큘럼 시스템의 핵심 데이터 모델을 정의합니다.
 """
 
-from .syllabus import Syllabus, Week, DayOverview
+from .syllabus import Syllabus, SyllabusMetadata, Week, DayOverview
 from .daily_content import (
     DailyContent,
+    DailyContentMetadata,
     OverviewSection,
     ScenarioSection,
     Concept,
@@ -29,10 +30,12 @@ from .config import CurriculumConfig
 __all__ = [
     # Syllabus models
     "Syllabus",
+    "SyllabusMetadata",
     "Week",
     "DayOverview",
     # Daily content models
     "DailyContent",
+    "DailyContentMetadata",
     "OverviewSection",
     "ScenarioSection",
     "Concept",
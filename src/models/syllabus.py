@@ -5,7 +5,7 @@
 """
 
 from datetime import datetime
-from typing import List, Literal
+from typing import Iterator, List, Literal, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -81,12 +81,17 @@ class Syllabus(BaseModel):
     metadata: SyllabusMetadata = Field(default_factory=SyllabusMetadata, description="메타데이터")
     weeks: List[Week] = Field(default_factory=list, description="주차 목록")
     
-    def get_day_by_global_number(self, global_day: int) -> DayOverview | None:
-        """전체 일차 번호로 일차 정보 조회"""
+    def iter_days(self) -> Iterator[Tuple[Week, DayOverview]]:
+        """주차 순서대로 (주차, 일차) 쌍을 하나씩 반환"""
         for week in self.weeks:
             for day in week.days:
-                if day.global_day_number == global_day:
-                    return day
+                yield week, day
+    
+    def get_day_by_global_number(self, global_day: int) -> DayOverview | None:
+        """전체 일차 번호로 일차 정보 조회"""
+        for _, day in self.iter_days():
+            if day.global_day_number == global_day:
+                return day
         return None
     
     def get_total_days(self) -> int:
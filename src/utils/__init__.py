@@ -3,10 +3,12 @@
 """
 
 from .config_loader import load_config
+from .syllabus_loader import load_syllabus
 from .file_utils import ensure_directory, write_file, read_file
 
 __all__ = [
     "load_config",
+    "load_syllabus",
     "ensure_directory",
     "write_file",
     "read_file",
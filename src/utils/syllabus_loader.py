@@ -0,0 +1,45 @@
+"""
+실러버스 파일 로더
+
+YAML 또는 JSON 형식의 실러버스 파일을 읽어 Syllabus 객체로 변환합니다.
+"""
+
+import json
+import yaml
+from pathlib import Path
+
+from ..models.syllabus import Syllabus
+
+
+def load_syllabus(syllabus_path: str) -> Syllabus:
+    """
+    실러버스 파일을 로드합니다.
+    
+    Args:
+        syllabus_path: 실러버스 파일 경로 (.yaml, .yml, .json)
+    
+    Returns:
+        Syllabus 객체
+    
+    Raises:
+        FileNotFoundError: 실러버스 파일이 없는 경우
+        ValueError: 실러버스 파일 형식이 잘못된 경우
+    """
+    syllabus_file = Path(syllabus_path)
+    
+    if not syllabus_file.exists():
+        raise FileNotFoundError(f"실러버스 파일을 찾을 수 없습니다: {syllabus_path}")
+    
+    try:
+        with open(syllabus_file, "r", encoding="utf-8") as f:
+            if syllabus_file.suffix == ".json":
+                syllabus_data = json.load(f)
+            else:
+                syllabus_data = yaml.safe_load(f)
+        
+        return Syllabus(**syllabus_data)
+    
+    except (json.JSONDecodeError, yaml.YAMLError) as e:
+        raise ValueError(f"실러버스 파일 파싱 오류: {e}")
+    except Exception as e:
+        raise ValueError(f"실러버스 파일 로드 오류: {e}")
@@ -4,6 +4,27 @@
 생성된 콘텐츠의 품질과 완전성을 검증합니다.
 """
 
+from .property_checks import (
+    AREA_KEYWORDS,
+    PROPERTIES,
+    ColumnBuilder,
+    CorrectnessProperty,
+    CurriculumColumns,
+    PropertyCheckEngine,
+    PropertyCheckResult,
+)
+
+__all__ = [
+    # Property checks
+    "AREA_KEYWORDS",
+    "PROPERTIES",
+    "ColumnBuilder",
+    "CorrectnessProperty",
+    "CurriculumColumns",
+    "PropertyCheckEngine",
+    "PropertyCheckResult",
+]
+
 # 향후 구현될 검증기들:
 # - ContentValidator
 # - ValidationResult
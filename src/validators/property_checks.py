@@ -0,0 +1,529 @@
+"""
+정확성 속성 배치 검증
+
+설계 문서의 Correctness Properties 중 구조화된 필드로 판정할 수 있는 속성을
+여러 커리큘럼에 대해 한 번에 검증합니다. Syllabus/DailyContent를 일차 단위
+행(row)의 열(column) 배열로 평탄화한 뒤, 각 속성을 NumPy 벡터 조건식으로
+평가하여 위반한 (커리큘럼, 일차) 목록을 반환합니다.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from ..models.config import CurriculumConfig
+from ..models.daily_content import DailyContent
+from ..models.syllabus import Syllabus
+
+
+FREE_TIER_INSTANCE_TYPES = ("t2.micro", "t3.micro")
+
+# Week 1-2 마지막 일차 (약점 영역 우선 배치 기준)
+WEAK_AREA_DEADLINE_DAY = 14
+
+# 통합 시나리오가 시작될 수 있는 마지막 기준 일차
+INTEGRATION_START_DAY = 21
+
+REQUIRED_TEST_TOOLS = ("pytest", "boto3", "moto")
+
+# 영역별 키워드 (일차 주제와 AWS 서비스 이름에서 단어 단위로 검색)
+AREA_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "Networking": (
+        "networking", "vpc", "subnet", "nat", "route 53", "route53", "transit gateway",
+        "vpn", "direct connect", "cloudfront", "elb", "alb", "nlb", "load balancing",
+        "peering", "nacl", "nacls",
+    ),
+    "Database": ("database", "rds", "aurora", "dynamodb", "elasticache", "dms", "redshift"),
+    "Storage": ("storage", "s3", "ebs", "efs", "fsx", "glacier", "storage gateway"),
+    "Governance": (
+        "governance", "config", "organizations", "control tower", "tagging", "compliance",
+        "budgets", "cost explorer", "trusted advisor",
+    ),
+    "Compute": ("compute", "ec2", "lambda", "ecs", "eks", "fargate", "auto scaling", "container"),
+    "Security": ("security", "iam", "kms", "waf", "shield", "guardduty", "secrets manager", "cognito"),
+    "Cost Optimization": ("cost", "budgets", "savings plans", "cost explorer"),
+    "Monitoring": ("monitoring", "logging", "cloudwatch", "cloudtrail", "x-ray"),
+    "High Availability": (
+        "high availability", "multi-az", "multi-region", "disaster recovery", "backup",
+        "replication", "read replicas", "auto scaling",
+    ),
+}
+
+# Property 1에서 모두 다뤄야 하는 SAA-C03 도메인
+EXAM_DOMAINS = (
+    "Compute", "Storage", "Database", "Networking", "Security",
+    "Cost Optimization", "Monitoring", "High Availability",
+)
+
+_INTEGRATION_PATTERN = re.compile(r"integration|통합|advanced scenario", re.IGNORECASE)
+_REVIEW_PATTERN = re.compile(r"review|복습", re.IGNORECASE)
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def _keyword_pattern(keywords: Sequence[str]) -> "re.Pattern[str]":
+    alternatives = "|".join(re.escape(keyword) for keyword in keywords)
+    return re.compile(rf"(?<![a-z0-9])(?:{alternatives})(?![a-z0-9])", re.IGNORECASE)
+
+
+_CONFIG_PATTERN = _keyword_pattern(("config",))
+_TAGGING_PATTERN = _keyword_pattern(("tagging", "tags", "tag", "cost allocation"))
+_COST_PATTERN = _keyword_pattern(("cost", "budgets", "cost explorer", "billing"))
+
+
+def _service_names(services: Sequence[str]) -> List[str]:
+    """중복과 공백을 제거한 소문자 서비스 이름"""
+    return sorted({service.strip().lower() for service in services if service.strip()})
+
+
+class CurriculumColumns:
+    """
+    일차 단위로 평탄화된 열 배열
+
+    행 하나가 (커리큘럼, 일차) 하나에 대응하며, `curriculum` 열이 행의
+    커리큘럼 인덱스를 가리킵니다. 커리큘럼 단위 값은 `weak_area_mask`처럼
+    길이가 커리큘럼 수인 배열로 둡니다.
+    """
+
+    def __init__(self, areas: Sequence[str], columns: Dict[str, np.ndarray], weak_area_mask: np.ndarray):
+        self.areas = tuple(areas)
+        self.weak_area_mask = weak_area_mask
+        self._columns = columns
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return self.__dict__["_columns"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def num_rows(self) -> int:
+        """행 수"""
+        return len(self._columns["day"])
+
+    @property
+    def num_curricula(self) -> int:
+        """커리큘럼 수"""
+        return len(self.weak_area_mask)
+
+    def area_bit(self, area: str) -> int:
+        """영역의 비트 마스크"""
+        return 1 << self.areas.index(area)
+
+    def per_curriculum_any(self, row_mask: np.ndarray) -> np.ndarray:
+        """행 조건을 커리큘럼 단위 OR로 집계"""
+        counts = np.bincount(self.curriculum, weights=row_mask, minlength=self.num_curricula)
+        return counts > 0
+
+
+def _unexpected_content(content: DailyContent) -> ValueError:
+    return ValueError(
+        f"Day {content.metadata.global_day_number} 콘텐츠가 순서를 벗어났거나 실러버스에 없는 "
+        f"일차입니다 (콘텐츠는 전체 일차 번호 오름차순이어야 합니다)"
+    )
+
+
+class ColumnBuilder:
+    """Syllabus/DailyContent를 열 배열로 평탄화"""
+
+    # 열 이름과 dtype
+    COLUMNS: Dict[str, type] = {
+        "curriculum": np.int32,
+        "day": np.int16,
+        "week": np.int8,
+        "area_mask": np.uint64,
+        "is_integration": np.bool_,
+        "is_review": np.bool_,
+        "covers_config": np.bool_,
+        "covers_tagging": np.bool_,
+        "covers_cost": np.bool_,
+        "has_content": np.bool_,
+        "uses_ec2": np.bool_,
+        "instance_free_tier": np.bool_,
+        "has_ssh_rule": np.bool_,
+        "has_key_pair": np.bool_,
+        "removal_destroy": np.bool_,
+        "auto_delete_objects": np.bool_,
+        "has_workflow": np.bool_,
+        "has_dockerfile": np.bool_,
+        "has_slack": np.bool_,
+        "has_tags": np.bool_,
+        "concept_count": np.int16,
+        "concepts_with_docs": np.int16,
+        "procedure_count": np.int16,
+        "service_count": np.int16,
+        "services_cleaned": np.int16,
+        "verification_required": np.bool_,
+        "test_tools_ok": np.bool_,
+        "quiz_questions": np.int8,
+        "quiz_well_formed": np.int8,
+        "quiz_aligned": np.int8,
+        "is_korean": np.bool_,
+    }
+
+    def __init__(self, areas: Sequence[str] = tuple(AREA_KEYWORDS)):
+        self.areas: List[str] = list(areas)
+        self._patterns = [_keyword_pattern(AREA_KEYWORDS.get(area, (area,))) for area in self.areas]
+        self._rows: Dict[str, list] = {name: [] for name in self.COLUMNS}
+        self._weak_masks: List[int] = []
+
+    def _area_index(self, area: str) -> int:
+        for index, known in enumerate(self.areas):
+            if known.lower() == area.lower():
+                return index
+        if len(self.areas) >= 64:
+            raise ValueError("영역은 최대 64개까지 지원합니다")
+        # 알려지지 않은 약점 영역은 이름 자체를 키워드로 사용합니다.
+        self.areas.append(area)
+        self._patterns.append(_keyword_pattern((area,)))
+        return len(self.areas) - 1
+
+    def add(
+        self,
+        syllabus: Syllabus,
+        config: CurriculumConfig,
+        contents: Optional[Iterable[DailyContent]] = None,
+    ) -> int:
+        """
+        커리큘럼 하나를 추가합니다.
+
+        Args:
+            syllabus: 실러버스
+            config: 커리큘럼 설정 (약점 영역 등)
+            contents: 생성된 일별 콘텐츠 (없으면 실러버스 수준 속성만 검증).
+                전체 일차 번호 오름차순이어야 하며(`iter_daily_content` 순서),
+                한 번에 한 일차씩만 소비합니다. 콘텐츠가 없는 일차는 허용합니다.
+
+        Returns:
+            커리큘럼 인덱스
+
+        Raises:
+            ValueError: 콘텐츠의 일차가 순서를 벗어나거나 실러버스에 없는 경우
+                (이 커리큘럼의 행은 추가되지 않습니다)
+        """
+        index = len(self._weak_masks)
+        weak_mask = 0
+        for area in config.weak_areas:
+            weak_mask |= 1 << self._area_index(area)
+
+        start = len(self._rows["day"])
+        try:
+            self._add_days(index, syllabus, config, contents)
+        except ValueError:
+            for values in self._rows.values():
+                del values[start:]
+            raise
+        self._weak_masks.append(weak_mask)
+        return index
+
+    def _add_days(
+        self,
+        index: int,
+        syllabus: Syllabus,
+        config: CurriculumConfig,
+        contents: Optional[Iterable[DailyContent]],
+    ) -> None:
+        remaining = iter(contents or ())
+        pending = next(remaining, None)
+        for week, day in syllabus.iter_days():
+            text = " ".join([day.topic] + list(day.aws_services))
+            area_mask = 0
+            for bit, pattern in enumerate(self._patterns):
+                if pattern.search(text):
+                    area_mask |= 1 << bit
+
+            row = self._rows
+            row["curriculum"].append(index)
+            row["day"].append(day.global_day_number)
+            row["week"].append(week.week_number)
+            row["area_mask"].append(area_mask)
+            row["is_integration"].append(bool(_INTEGRATION_PATTERN.search(day.topic)))
+            row["is_review"].append(bool(_REVIEW_PATTERN.search(day.topic)))
+            row["covers_config"].append(bool(_CONFIG_PATTERN.search(text)))
+            row["covers_tagging"].append(bool(_TAGGING_PATTERN.search(text)))
+            row["covers_cost"].append(bool(_COST_PATTERN.search(text)))
+            row["verification_required"].append(config.include_verification_tests)
+            row["service_count"].append(len(_service_names(day.aws_services)))
+
+            # 이 일차의 콘텐츠만 소비합니다. 다음 콘텐츠가 이 일차보다 앞서면
+            # 순서가 어긋났거나 실러버스에 없는 일차이므로 조용히 건너뛰지 않습니다.
+            if pending is not None and pending.metadata.global_day_number < day.global_day_number:
+                raise _unexpected_content(pending)
+            content = None
+            if pending is not None and pending.metadata.global_day_number == day.global_day_number:
+                content, pending = pending, next(remaining, None)
+            self._add_content(content, day.aws_services, text)
+
+        if pending is not None:
+            raise _unexpected_content(pending)
+
+    def _add_content(self, content: Optional[DailyContent], services: Sequence[str], day_text: str) -> None:
+        row = self._rows
+        row["has_content"].append(content is not None)
+        if content is None:
+            for name in (
+                "uses_ec2", "instance_free_tier", "has_ssh_rule", "has_key_pair",
+                "removal_destroy", "auto_delete_objects", "has_workflow", "has_dockerfile",
+                "has_slack", "has_tags", "test_tools_ok", "is_korean",
+            ):
+                row[name].append(False)
+            for name in (
+                "concept_count", "concepts_with_docs", "procedure_count", "services_cleaned",
+                "quiz_questions", "quiz_well_formed", "quiz_aligned",
+            ):
+                row[name].append(0)
+            return
+
+        cdk = content.cdk_lab
+        code = cdk.stack_code
+        pipeline = cdk.cicd_pipeline
+        concepts = content.key_concepts.concepts
+        concept_names = {concept.name.lower() for concept in concepts}
+        questions = content.quiz.questions
+
+        row["uses_ec2"].append(
+            bool(re.search(r"(?<![a-z0-9])ec2(?![a-z0-9])", day_text, re.IGNORECASE))
+            or "ec2.Instance" in code
+        )
+        row["instance_free_tier"].append(cdk.instance_type in FREE_TIER_INSTANCE_TYPES)
+        row["has_ssh_rule"].append(any(rule.port == 22 for rule in cdk.security_group_rules))
+        row["has_key_pair"].append(bool(cdk.key_pair_name))
+        row["removal_destroy"].append(cdk.cleanup_config.removal_policy.upper() == "DESTROY")
+        row["auto_delete_objects"].append(cdk.cleanup_config.auto_delete_objects)
+        row["has_workflow"].append(bool(pipeline.github_actions_workflow.strip()))
+        row["has_dockerfile"].append(bool(pipeline.dockerfile.strip()))
+        row["has_slack"].append(
+            bool(pipeline.slack_webhook) or "slack" in pipeline.github_actions_workflow.lower()
+        )
+        row["has_tags"].append("Tags.of(" in code)
+        row["concept_count"].append(len(concepts))
+        row["concepts_with_docs"].append(
+            sum(
+                1
+                for concept in concepts
+                if any("docs.aws.amazon.com" in url for url in concept.official_docs)
+            )
+        )
+        row["procedure_count"].append(len(content.console_lab.procedures))
+        cleaned = [step.resource_type.lower() for step in content.console_lab.cleanup_steps]
+        row["services_cleaned"].append(
+            sum(
+                1
+                for service in _service_names(services)
+                if any(service in resource or resource in service for resource in cleaned)
+            )
+        )
+        tools = {tool.lower() for tool in content.verification.tools}
+        row["test_tools_ok"].append(all(tool in tools for tool in REQUIRED_TEST_TOOLS))
+        row["quiz_questions"].append(len(questions))
+        row["quiz_well_formed"].append(
+            sum(
+                1
+                for question in questions
+                if len(question.options) == 4
+                and question.correct_answer in ("A", "B", "C", "D")
+                and _HANGUL_PATTERN.search(question.explanation)
+            )
+        )
+        row["quiz_aligned"].append(
+            sum(1 for question in questions if question.related_concept.lower() in concept_names)
+        )
+        row["is_korean"].append(bool(_HANGUL_PATTERN.search(content.overview.description)))
+
+    def build(self) -> CurriculumColumns:
+        """열 배열 생성"""
+        columns: Dict[str, np.ndarray] = {
+            name: np.asarray(values, dtype=self.COLUMNS[name])
+            for name, values in self._rows.items()
+        }
+        return CurriculumColumns(
+            self.areas,
+            columns,
+            np.asarray(self._weak_masks, dtype=np.uint64),
+        )
+
+
+# 속성 판정 결과: (행 위반 마스크, 커리큘럼 위반 마스크) - 해당 없는 쪽은 None
+PropertyOutcome = Tuple[Optional[np.ndarray], Optional[np.ndarray]]
+
+
+class CorrectnessProperty(BaseModel):
+    """정확성 속성 정의"""
+
+    property_id: int = Field(..., ge=1, le=21, description="설계 문서의 속성 번호")
+    name: str = Field(..., min_length=1, description="속성 이름")
+    check: Callable[[CurriculumColumns], PropertyOutcome] = Field(..., description="벡터 판정 함수")
+
+
+class PropertyCheckResult(BaseModel):
+    """속성 검증 결과"""
+
+    property_id: int = Field(..., description="속성 번호")
+    name: str = Field(..., description="속성 이름")
+    violating_days: List[Tuple[int, int]] = Field(
+        default_factory=list,
+        description="위반한 (커리큘럼 인덱스, 전체 일차 번호)"
+    )
+    violating_curricula: List[int] = Field(default_factory=list, description="위반한 커리큘럼 인덱스")
+
+    @property
+    def passed(self) -> bool:
+        """위반 없음 여부"""
+        return not self.violating_curricula
+
+
+def _complete_syllabus_coverage(c: CurriculumColumns) -> PropertyOutcome:
+    day_counts = np.bincount(c.curriculum, minlength=c.num_curricula)
+    violating = day_counts != 30
+    for domain in EXAM_DOMAINS:
+        covered = c.per_curriculum_any((c.area_mask & np.uint64(c.area_bit(domain))) != 0)
+        violating |= ~covered
+    return None, violating
+
+
+def _weak_area_prioritization(c: CurriculumColumns) -> PropertyOutcome:
+    rows = np.zeros(c.num_rows, dtype=bool)
+    uncovered = np.zeros(c.num_curricula, dtype=bool)
+    sentinel = np.iinfo(np.int16).max
+    for area in c.areas:
+        bit = np.uint64(c.area_bit(area))
+        is_weak = (c.weak_area_mask & bit) != 0
+        if not is_weak.any():
+            continue
+        in_area = (c.area_mask & bit) != 0
+        first_day = np.full(c.num_curricula, sentinel, dtype=np.int16)
+        np.minimum.at(first_day, c.curriculum[in_area], c.day[in_area])
+        late = is_weak & (first_day > WEAK_AREA_DEADLINE_DAY)
+        uncovered |= is_weak & (first_day == sentinel)
+        # 약점 영역의 첫 일차가 Week 1-2를 벗어난 경우 그 일차를 위반으로 표시
+        rows |= in_area & late[c.curriculum] & (c.day == first_day[c.curriculum])
+    return rows, uncovered
+
+
+def _integration_sequencing(c: CurriculumColumns) -> PropertyOutcome:
+    return c.is_integration & ~c.is_review & (c.day <= INTEGRATION_START_DAY), None
+
+
+def _aws_documentation_references(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & ((c.concept_count == 0) | (c.concepts_with_docs < c.concept_count)), None
+
+
+def _console_cleanup(c: CurriculumColumns) -> PropertyOutcome:
+    # 실습에서 다루는 서비스마다 정리 단계가 있어야 함
+    return c.has_content & (c.procedure_count > 0) & (c.services_cleaned < c.service_count), None
+
+
+def _cdk_free_tier(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & c.uses_ec2 & ~c.instance_free_tier, None
+
+
+def _cdk_ssh_access(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & c.uses_ec2 & ~(c.has_ssh_rule & c.has_key_pair), None
+
+
+def _cdk_perfect_cleanup(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & ~(c.removal_destroy & c.auto_delete_objects), None
+
+
+def _cicd_tool_selection(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & ~(c.has_workflow & c.has_dockerfile & c.has_slack), None
+
+
+def _governance_coverage(c: CurriculumColumns) -> PropertyOutcome:
+    covered = (
+        c.per_curriculum_any(c.covers_config)
+        & c.per_curriculum_any(c.covers_tagging)
+        & c.per_curriculum_any(c.covers_cost)
+    )
+    return None, ~covered
+
+
+def _cdk_tagging(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & ~c.has_tags, None
+
+
+def _test_framework_usage(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & c.verification_required & ~c.test_tools_ok, None
+
+
+def _korean_language(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & ~c.is_korean, None
+
+
+def _quiz_structure(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & ((c.quiz_questions != 5) | (c.quiz_well_formed != c.quiz_questions)), None
+
+
+def _quiz_alignment(c: CurriculumColumns) -> PropertyOutcome:
+    return c.has_content & (c.quiz_aligned < c.quiz_questions), None
+
+
+# 구조화된 필드로 판정 가능한 속성
+# (4, 6, 8, 14, 17, 19는 파일/텍스트 분석이 필요하여 ContentValidator 범위입니다)
+PROPERTIES: Tuple[CorrectnessProperty, ...] = (
+    CorrectnessProperty(property_id=1, name="Complete Syllabus Coverage", check=_complete_syllabus_coverage),
+    CorrectnessProperty(property_id=2, name="Weak Area Prioritization", check=_weak_area_prioritization),
+    CorrectnessProperty(property_id=3, name="Integration Scenario Sequencing", check=_integration_sequencing),
+    CorrectnessProperty(property_id=5, name="Korean Language Completeness", check=_korean_language),
+    CorrectnessProperty(property_id=7, name="AWS Documentation References", check=_aws_documentation_references),
+    CorrectnessProperty(property_id=9, name="Console Lab Cleanup Completeness", check=_console_cleanup),
+    CorrectnessProperty(property_id=10, name="CDK Free Tier Compliance", check=_cdk_free_tier),
+    CorrectnessProperty(property_id=11, name="CDK SSH Access Configuration", check=_cdk_ssh_access),
+    CorrectnessProperty(property_id=12, name="CDK Perfect Cleanup Configuration", check=_cdk_perfect_cleanup),
+    CorrectnessProperty(property_id=13, name="CI/CD Tool Selection", check=_cicd_tool_selection),
+    CorrectnessProperty(property_id=15, name="Governance Topic Coverage", check=_governance_coverage),
+    CorrectnessProperty(property_id=16, name="CDK Tagging Implementation", check=_cdk_tagging),
+    CorrectnessProperty(property_id=18, name="Test Framework Usage", check=_test_framework_usage),
+    CorrectnessProperty(property_id=20, name="Quiz Structure Compliance", check=_quiz_structure),
+    CorrectnessProperty(property_id=21, name="Quiz Content Alignment", check=_quiz_alignment),
+)
+
+
+class PropertyCheckEngine:
+    """
+    정확성 속성 배치 검증 엔진
+
+    Args:
+        properties: 검증할 속성 (기본값: 전체 PROPERTIES)
+    """
+
+    def __init__(self, properties: Optional[Sequence[CorrectnessProperty]] = None):
+        self.properties = tuple(properties) if properties is not None else PROPERTIES
+
+    def run(self, columns: CurriculumColumns) -> List[PropertyCheckResult]:
+        """평탄화된 열 배열에 모든 속성을 적용합니다."""
+        results = []
+        for prop in self.properties:
+            row_mask, curriculum_mask = prop.check(columns)
+            violating = np.zeros(columns.num_curricula, dtype=bool)
+            violating_days: List[Tuple[int, int]] = []
+
+            if row_mask is not None:
+                rows = np.flatnonzero(row_mask)
+                violating_days = list(
+                    zip(columns.curriculum[rows].tolist(), columns.day[rows].tolist())
+                )
+                violating[columns.curriculum[rows]] = True
+            if curriculum_mask is not None:
+                violating |= curriculum_mask
+
+            results.append(
+                PropertyCheckResult(
+                    property_id=prop.property_id,
+                    name=prop.name,
+                    violating_days=violating_days,
+                    violating_curricula=np.flatnonzero(violating).tolist(),
+                )
+            )
+        return results
+
+    def audit(
+        self,
+        curricula: Iterable[Tuple[Syllabus, CurriculumConfig, Optional[Iterable[DailyContent]]]],
+    ) -> List[PropertyCheckResult]:
+        """커리큘럼들을 평탄화하여 검증합니다."""
+        builder = ColumnBuilder()
+        for syllabus, config, contents in curricula:
+            builder.add(syllabus, config, contents)
+        return self.run(builder.build())
@@ -0,0 +1,47 @@
+"""
+공용 테스트 픽스처
+"""
+
+import pytest
+
+from src.models import CurriculumConfig, DayOverview, Syllabus, Week
+
+
+def build_syllabus(days_per_week: int = 2, weeks: int = 2) -> Syllabus:
+    """테스트용 소형 실러버스 생성"""
+    services = [["VPC", "EC2"], ["S3"], ["RDS"], ["Lambda"], ["CloudWatch"], ["IAM"], ["EBS"]]
+    week_list = []
+    global_day = 1
+    for week_number in range(1, weeks + 1):
+        days = []
+        for day_number in range(1, days_per_week + 1):
+            days.append(
+                DayOverview(
+                    day_number=day_number,
+                    global_day_number=global_day,
+                    topic=f"Topic {global_day}",
+                    aws_services=services[(global_day - 1) % len(services)],
+                )
+            )
+            global_day += 1
+        week_list.append(
+            Week(
+                week_number=week_number,
+                theme=f"Week {week_number}",
+                description=f"{week_number}주차 설명",
+                days=days,
+            )
+        )
+    return Syllabus(weeks=week_list)
+
+
+@pytest.fixture
+def sample_syllabus() -> Syllabus:
+    """2주 x 2일 실러버스"""
+    return build_syllabus()
+
+
+@pytest.fixture
+def config() -> CurriculumConfig:
+    """기본 설정"""
+    return CurriculumConfig()
@@ -0,0 +1,132 @@
+"""
+아카이브 내보내기 테스트
+"""
+
+import asyncio
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from src.generators import (
+    ContentSourceClient,
+    DailyContentGenerator,
+    GenerationOrchestrator,
+    StubContentSource,
+    archive_exporter,
+    archive_format,
+    export_archive,
+    iter_export_files,
+)
+from src.models import CurriculumConfig
+
+from .conftest import build_syllabus
+
+
+@pytest.fixture
+def output_tree(tmp_path):
+    """스텁 소스로 생성한 출력 트리"""
+    output = tmp_path / "output"
+    generator = DailyContentGenerator(ContentSourceClient(StubContentSource()), CurriculumConfig())
+    asyncio.run(GenerationOrchestrator(generator, str(output)).run(build_syllabus(weeks=3)))
+    (output / "syllabus.md").write_text("# 실러버스\n", encoding="utf-8")
+    return output
+
+
+def expected_files(output):
+    """아카이브에 들어가야 할 파일 (경로 -> 내용)"""
+    return {
+        path.relative_to(output).as_posix(): path.read_bytes()
+        for path in output.rglob("*")
+        if path.is_file()
+        and not any(part.startswith(".") for part in path.relative_to(output).parts)
+        and path.name != "content.json"
+    }
+
+
+class TestArchiveFormat:
+    """아카이브 형식 판별 테스트"""
+
+    def test_archive_format(self):
+        """확장자로 형식을 판별하고 지원하지 않는 형식은 ValueError"""
+        assert archive_format("out/curriculum.tar.zst") == "tar.zst"
+        assert archive_format("CURRICULUM.ZIP") == "zip"
+        with pytest.raises(ValueError):
+            archive_format("curriculum.tar.gz")
+
+
+class TestExportArchive:
+    """아카이브 내보내기 테스트"""
+
+    def test_export_files_are_ordered_and_filtered(self, output_tree):
+        """숫자 순서로 정렬하고 숨김 디렉토리와 content.json은 제외"""
+        names = [name for name, _ in iter_export_files(str(output_tree))]
+
+        assert names[0] == "syllabus.md"
+        assert names.index("week1/day1/README.md") < names.index("week1/day2/README.md")
+        assert names.index("week2/day4/README.md") < names.index("week3/day5/README.md")
+        assert not any(name.startswith(".") or name.endswith("content.json") for name in names)
+
+        with_content = [name for name, _ in iter_export_files(str(output_tree), include_content=True)]
+        assert "week1/day1/content.json" in with_content
+
+    def test_zip_export_round_trip(self, output_tree, tmp_path):
+        """zip 아카이브를 풀면 원본 트리와 같음"""
+        archive = tmp_path / "dist" / "curriculum.zip"
+        summary = export_archive(str(output_tree), str(archive), workers=4)
+
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
+            contents = {info.filename: zf.read(info) for info in zf.infolist()}
+        assert contents == expected_files(output_tree)
+        assert summary.files == len(contents)
+        assert summary.archive_bytes == archive.stat().st_size
+        assert summary.ratio < 1
+        assert not (tmp_path / "dist" / "curriculum.zip.tmp").exists()
+
+    def test_tar_zst_export_round_trip(self, output_tree, tmp_path):
+        """tar.zst 아카이브를 풀면 원본 트리와 같음"""
+        zstandard = pytest.importorskip("zstandard")
+        archive = tmp_path / "curriculum.tar.zst"
+        summary = export_archive(str(output_tree), str(archive), workers=2)
+
+        with open(archive, "rb") as f:
+            data = zstandard.ZstdDecompressor().stream_reader(f).read()
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            contents = {member.name: tar.extractfile(member).read() for member in tar.getmembers()}
+        assert contents == expected_files(output_tree)
+        assert summary.files == len(contents)
+
+    def test_archive_inside_output_is_excluded(self, output_tree):
+        """출력 디렉토리 안의 아카이브는 자기 자신을 포함하지 않음"""
+        archive = output_tree / "curriculum.zip"
+        export_archive(str(output_tree), str(archive))
+        summary = export_archive(str(output_tree), str(archive))
+
+        with zipfile.ZipFile(archive) as zf:
+            assert "curriculum.zip" not in zf.namelist()
+            assert len(zf.namelist()) == summary.files
+
+    def test_zip_size_limits_raise_value_error(self, output_tree, tmp_path, monkeypatch):
+        """항목 또는 중앙 디렉토리가 zip 크기 제한을 넘으면 ValueError"""
+        archive = tmp_path / "curriculum.zip"
+        export_archive(str(output_tree), str(archive))
+        with zipfile.ZipFile(archive) as zf:
+            directory_offset = zf.start_dir
+
+        # 마지막 항목까지는 들어가지만 중앙 디렉토리는 넘치는 경우
+        monkeypatch.setattr(archive_exporter, "_ZIP_MAX_SIZE", directory_offset + 1)
+        with pytest.raises(ValueError):
+            export_archive(str(output_tree), str(archive))
+
+        # 항목의 로컬 헤더까지 포함해 넘치는 경우
+        monkeypatch.setattr(archive_exporter, "_ZIP_MAX_SIZE", directory_offset - 1)
+        with pytest.raises(ValueError):
+            export_archive(str(output_tree), str(archive))
+        assert not (tmp_path / "curriculum.zip.tmp").exists()
+
+    def test_missing_output_directory(self, tmp_path):
+        """출력 디렉토리가 없으면 ValueError"""
+        with pytest.raises(ValueError):
+            export_archive(str(tmp_path / "missing"), str(tmp_path / "curriculum.zip"))
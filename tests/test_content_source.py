@@ -0,0 +1,243 @@
+"""
+콘텐츠 소스 계층 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.generators import (
+    ContentGenerationError,
+    ContentRequest,
+    ContentSource,
+    ContentSourceClient,
+    ContentSourceError,
+    DailyContentGenerator,
+    LocalContentPackSource,
+    StubContentSource,
+)
+from src.models import CurriculumConfig, DailyContent, DayOverview
+
+
+def make_request(section: str = "overview", day: int = 1, topic: str = "VPC Basics") -> ContentRequest:
+    """테스트용 요청 생성"""
+    return ContentRequest.for_section(
+        section,
+        DayOverview(day_number=1, global_day_number=day, topic=topic, aws_services=["VPC"]),
+        CurriculumConfig(),
+    )
+
+
+class CountingSource(ContentSource):
+    """호출 횟수와 최대 동시 실행 수를 기록하는 소스"""
+
+    def __init__(self, delay: float = 0.01, failures: int = 0):
+        self.delay = delay
+        self.failures = failures
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.stub = StubContentSource()
+
+    async def fetch(self, request):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                raise ContentSourceError("일시적 오류")
+            return await self.stub.fetch(request)
+        finally:
+            self.active -= 1
+
+
+class TestContentRequest:
+    """요청 정규화 테스트"""
+
+    def test_key_ignores_day_number_and_service_order(self):
+        """일차 번호와 서비스 순서는 키에 영향을 주지 않음"""
+        config = CurriculumConfig()
+        a = ContentRequest.for_section(
+            "quiz",
+            DayOverview(day_number=1, global_day_number=1, topic="VPC", aws_services=["VPC", "EC2"]),
+            config,
+        )
+        b = ContentRequest.for_section(
+            "quiz",
+            DayOverview(day_number=3, global_day_number=10, topic="VPC ", aws_services=["EC2", "VPC"]),
+            config,
+        )
+        assert a.key() == b.key()
+
+    def test_key_includes_relevant_config(self):
+        """섹션 관련 설정만 키에 반영"""
+        day = DayOverview(day_number=1, global_day_number=1, topic="EC2")
+        base = CurriculumConfig()
+        other_instance = CurriculumConfig(default_instance_type="t3.micro")
+        other_weak = CurriculumConfig(weak_areas=["Networking"])
+
+        cdk = ContentRequest.for_section("cdk_lab", day, base).key()
+        assert ContentRequest.for_section("cdk_lab", day, other_instance).key() != cdk
+        assert ContentRequest.for_section("cdk_lab", day, other_weak).key() == cdk
+        assert ContentRequest.for_section("quiz", day, other_instance).key() == \
+            ContentRequest.for_section("quiz", day, base).key()
+
+
+class TestContentSourceClient:
+    """비동기 클라이언트 테스트"""
+
+    def test_bounded_concurrency(self):
+        """동시 실행 수가 제한을 넘지 않음"""
+        source = CountingSource()
+        client = ContentSourceClient(source, max_concurrency=3)
+
+        async def run():
+            await asyncio.gather(*(client.fetch(make_request(topic=f"T{i}")) for i in range(12)))
+
+        asyncio.run(run())
+        assert source.calls == 12
+        assert source.max_active == 3
+
+    def test_coalesces_identical_requests(self):
+        """동일 요청은 한 번만 호출"""
+        source = CountingSource()
+        client = ContentSourceClient(source)
+
+        async def run():
+            return await asyncio.gather(*(client.fetch(make_request(day=d)) for d in range(1, 6)))
+
+        results = asyncio.run(run())
+        assert source.calls == 1
+        assert all(result == results[0] for result in results)
+
+    def test_retries_then_succeeds(self):
+        """일시적 오류 후 재시도로 성공"""
+        source = CountingSource(failures=2)
+        client = ContentSourceClient(source, backoff_base=0.001)
+
+        result = asyncio.run(client.fetch(make_request()))
+        assert "description" in result
+        assert source.calls == 3
+
+    def test_raises_generation_error_after_retries(self):
+        """재시도 소진 시 ContentGenerationError"""
+        source = CountingSource(failures=10)
+        client = ContentSourceClient(source, max_retries=3, backoff_base=0.001)
+
+        with pytest.raises(ContentGenerationError) as exc_info:
+            asyncio.run(client.fetch(make_request(section="quiz", day=7)))
+
+        assert source.calls == 4
+        assert exc_info.value.day == 7
+        assert exc_info.value.section == "quiz"
+
+    def test_timeout_is_retried(self):
+        """타임아웃도 재시도 대상"""
+        source = CountingSource(delay=0.5)
+        client = ContentSourceClient(source, timeout=0.01, max_retries=1, backoff_base=0.001)
+
+        with pytest.raises(ContentGenerationError):
+            asyncio.run(client.fetch(make_request()))
+        assert source.calls == 2
+
+
+class TestLocalContentPackSource:
+    """로컬 콘텐츠 팩 테스트"""
+
+    def test_loads_yaml_and_json(self, tmp_path):
+        """YAML/JSON 팩 로드"""
+        (tmp_path / "day1.yaml").write_text(
+            "overview:\n  description: VPC 개요\narchitecture_diagram: graph TB\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "day2.json").write_text(
+            json.dumps({"scenario": {"context": "시나리오"}}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        source = LocalContentPackSource(str(tmp_path))
+
+        async def run():
+            return (
+                await source.fetch(make_request("overview", day=1)),
+                await source.fetch(make_request("architecture_diagram", day=1)),
+                await source.fetch(make_request("scenario", day=2)),
+            )
+
+        overview, diagram, scenario = asyncio.run(run())
+        assert overview["description"] == "VPC 개요"
+        assert diagram == {"mermaid": "graph TB"}
+        assert scenario["context"] == "시나리오"
+
+    def test_same_topic_days_are_not_coalesced(self, tmp_path):
+        """주제가 같아도 일차별 팩 파일을 따로 읽음"""
+        for day in (7, 14):
+            (tmp_path / f"day{day}.yaml").write_text(
+                f"overview:\n  description: day {day} review\n", encoding="utf-8"
+            )
+        client = ContentSourceClient(LocalContentPackSource(str(tmp_path)))
+
+        async def run():
+            return await asyncio.gather(
+                *(client.fetch(make_request(day=day, topic="Weekly Review")) for day in (7, 14))
+            )
+
+        day7, day14 = asyncio.run(run())
+        assert day7 == {"description": "day 7 review"}
+        assert day14 == {"description": "day 14 review"}
+
+    def test_missing_section(self, tmp_path):
+        """섹션이 없으면 ContentSourceError"""
+        source = LocalContentPackSource(str(tmp_path))
+
+        with pytest.raises(ContentSourceError):
+            asyncio.run(source.fetch(make_request("quiz", day=3)))
+
+
+class TestDailyContentGenerator:
+    """일별 콘텐츠 생성기 테스트"""
+
+    def test_generates_all_days(self, sample_syllabus, config):
+        """실러버스 전체 일차 생성"""
+        generator = DailyContentGenerator(ContentSourceClient(StubContentSource()), config)
+
+        contents = asyncio.run(generator.generate_syllabus_content(sample_syllabus))
+
+        assert len(contents) == sample_syllabus.get_total_days()
+        assert all(isinstance(content, DailyContent) for content in contents)
+        assert [c.metadata.global_day_number for c in contents] == [1, 2, 3, 4]
+        assert contents[2].metadata.week_number == 2
+        assert len(contents[0].quiz.questions) == 5
+        assert contents[0].architecture_diagram.startswith("graph TB")
+
+    def test_fans_out_all_sections(self, sample_syllabus, config):
+        """모든 일차의 섹션이 동시에 발행됨"""
+        source = CountingSource(delay=0.05)
+        generator = DailyContentGenerator(ContentSourceClient(source, max_concurrency=64), config)
+
+        asyncio.run(generator.generate_syllabus_content(sample_syllabus))
+
+        assert source.max_active == source.calls == 4 * 8
+
+    def test_skips_disabled_sections(self, sample_syllabus):
+        """설정으로 비활성화된 섹션은 생성하지 않음"""
+        config = CurriculumConfig(include_architecture_diagrams=False)
+        generator = DailyContentGenerator(ContentSourceClient(StubContentSource()), config)
+
+        contents = asyncio.run(generator.generate_syllabus_content(sample_syllabus))
+        assert contents[0].architecture_diagram == ""
+
+    def test_invalid_payload_raises(self, sample_syllabus, config):
+        """섹션 형식 오류는 ContentGenerationError"""
+
+        class BrokenSource(StubContentSource):
+            def _build_quiz(self, request):
+                return {"questions": []}
+
+        generator = DailyContentGenerator(ContentSourceClient(BrokenSource()), config)
+
+        with pytest.raises(ContentGenerationError) as exc_info:
+            asyncio.run(generator.generate_syllabus_content(sample_syllabus))
+        assert exc_info.value.section == "quiz"
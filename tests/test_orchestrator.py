@@ -0,0 +1,178 @@
+"""
+체크포인트 기반 생성 오케스트레이터 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from src.generators import (
+    CheckpointMismatchError,
+    ContentSourceClient,
+    ContentSourceError,
+    DailyContentGenerator,
+    GenerationJournal,
+    GenerationOrchestrator,
+    StubContentSource,
+)
+from src.main import main
+from src.models import CurriculumConfig
+
+from .conftest import build_syllabus
+
+
+class FlakySource(StubContentSource):
+    """지정한 일차의 섹션 요청을 실패시키는 스텁 소스"""
+
+    def __init__(self, failing_days=(), failing_section="quiz"):
+        self.failing_days = set(failing_days)
+        self.failing_section = failing_section
+        self.requested_days = []
+
+    async def fetch(self, request):
+        self.requested_days.append(request.global_day_number)
+        if request.global_day_number in self.failing_days and request.section == self.failing_section:
+            raise ContentSourceError("서비스 응답 오류")
+        return await super().fetch(request)
+
+
+def make_orchestrator(source, output_directory, config=None) -> GenerationOrchestrator:
+    """테스트용 오케스트레이터"""
+    client = ContentSourceClient(source, max_retries=1, backoff_base=0.001)
+    generator = DailyContentGenerator(client, config or CurriculumConfig())
+    return GenerationOrchestrator(generator, str(output_directory), chunk_size=3)
+
+
+class TestGenerationOrchestrator:
+    """오케스트레이터 테스트"""
+
+    def test_generates_day_directories(self, tmp_path, sample_syllabus):
+        """모든 일차 디렉토리와 저널 기록 생성"""
+        orchestrator = make_orchestrator(StubContentSource(), tmp_path)
+
+        report = asyncio.run(orchestrator.run(sample_syllabus))
+
+        assert report.succeeded
+        assert report.generated == [1, 2, 3, 4]
+        day_dir = tmp_path / "week2" / "day3"
+        assert (day_dir / "README.md").read_text(encoding="utf-8").startswith("# Day 3: Topic 3")
+        assert (day_dir / "content.json").exists()
+        assert (day_dir / "part1_console" / "README.md").exists()
+        assert (day_dir / "part2_cdk" / "README.md").exists()
+        assert GenerationJournal(str(tmp_path)).completed_days() == [1, 2, 3, 4]
+
+    def test_failure_is_quarantined_and_resumed(self, tmp_path, sample_syllabus):
+        """실패 일차만 격리되고 재개 시 그 일차만 다시 생성"""
+        source = FlakySource(failing_days={3})
+        report = asyncio.run(make_orchestrator(source, tmp_path).run(sample_syllabus))
+
+        assert report.generated == [1, 2, 4]
+        assert len(report.failed) == 1
+        failed = report.failed[0]
+        assert (failed.day, failed.section, failed.stage) == (3, "quiz", "content")
+        assert "서비스 응답 오류" in failed.details
+        assert GenerationJournal(str(tmp_path)).get_quarantined(3) is not None
+
+        retry_source = FlakySource()
+        report = asyncio.run(make_orchestrator(retry_source, tmp_path).run(sample_syllabus, resume=True))
+
+        assert report.succeeded
+        assert report.generated == [3]
+        assert report.skipped == [1, 2, 4]
+        assert set(retry_source.requested_days) == {3}
+        journal = GenerationJournal(str(tmp_path))
+        assert journal.quarantined() == []
+        assert journal.completed_days() == [1, 2, 3, 4]
+
+    def test_unexpected_error_is_quarantined(self, tmp_path, sample_syllabus):
+        """예기치 않은 예외도 해당 일차만 격리하고 나머지 일차를 계속 진행"""
+
+        class BrokenSource(StubContentSource):
+            async def fetch(self, request):
+                if request.global_day_number == 2:
+                    raise RuntimeError("backend crashed")
+                return await super().fetch(request)
+
+        report = asyncio.run(make_orchestrator(BrokenSource(), tmp_path).run(sample_syllabus))
+
+        assert report.generated == [1, 3, 4]
+        [failed] = report.failed
+        assert (failed.day, failed.stage) == (2, "content")
+        assert "RuntimeError('backend crashed')" in failed.details
+
+    def test_slow_day_does_not_block_later_days(self, tmp_path, sample_syllabus):
+        """한 일차가 늦어져도 창의 빈자리로 다음 일차를 시작"""
+
+        class SlowFirstDaySource(StubContentSource):
+            def __init__(self):
+                self.day4_started = asyncio.Event()
+
+            async def fetch(self, request):
+                if request.global_day_number == 4:
+                    self.day4_started.set()
+                elif request.global_day_number == 1 and request.section == "quiz":
+                    await self.day4_started.wait()
+                return await super().fetch(request)
+
+        async def run():
+            orchestrator = make_orchestrator(SlowFirstDaySource(), tmp_path)
+            return await asyncio.wait_for(orchestrator.run(sample_syllabus), timeout=5)
+
+        report = asyncio.run(run())
+
+        assert report.succeeded
+        assert report.generated == [1, 2, 3, 4]
+
+    def test_resume_renders_from_saved_content(self, tmp_path, sample_syllabus):
+        """content 단계가 끝난 일차는 저장된 content.json으로 렌더링만 수행"""
+        orchestrator = make_orchestrator(StubContentSource(), tmp_path)
+        asyncio.run(orchestrator.run(sample_syllabus))
+
+        # Day 2 렌더링 전에 중단된 상황 재현
+        journal_path = tmp_path / ".generation" / "journal.jsonl"
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+        kept = [line for line in lines if not ('"day": 2' in line and '"render"' in line)]
+        journal_path.write_text("\n".join(kept) + "\n", encoding="utf-8")
+        (tmp_path / "week1" / "day2" / "README.md").unlink()
+
+        source = FlakySource()
+        report = asyncio.run(make_orchestrator(source, tmp_path).run(sample_syllabus, resume=True))
+
+        assert report.generated == [2]
+        assert source.requested_days == []
+        assert (tmp_path / "week1" / "day2" / "README.md").exists()
+
+    def test_fresh_run_resets_journal(self, tmp_path, sample_syllabus):
+        """--resume 없이 실행하면 처음부터 다시 생성"""
+        asyncio.run(make_orchestrator(StubContentSource(), tmp_path).run(sample_syllabus))
+
+        report = asyncio.run(make_orchestrator(StubContentSource(), tmp_path).run(sample_syllabus))
+        assert report.generated == [1, 2, 3, 4]
+        assert report.skipped == []
+
+    def test_resume_rejects_different_syllabus(self, tmp_path, sample_syllabus):
+        """다른 실러버스로 재개하면 오류"""
+        asyncio.run(make_orchestrator(FlakySource({1}), tmp_path).run(sample_syllabus))
+
+        with pytest.raises(CheckpointMismatchError):
+            asyncio.run(
+                make_orchestrator(StubContentSource(), tmp_path).run(build_syllabus(weeks=1), resume=True)
+            )
+
+
+class TestGenerateAllCommand:
+    """generate-all CLI 테스트"""
+
+    def test_generate_all_and_resume(self, tmp_path, sample_syllabus, capsys):
+        """CLI 실행 및 재개"""
+        syllabus_path = tmp_path / "syllabus.json"
+        syllabus_path.write_text(sample_syllabus.model_dump_json(), encoding="utf-8")
+        output = tmp_path / "output"
+        args = ["generate-all", "--syllabus", str(syllabus_path), "--output", str(output)]
+
+        assert main(args) == 0
+        assert (output / "week1" / "day1" / "README.md").exists()
+        assert (output / ".cache" / "responses.sqlite3").exists()
+
+        assert main(args + ["--resume"]) == 0
+        assert "건너뜀: 4일" in capsys.readouterr().out
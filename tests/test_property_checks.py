@@ -0,0 +1,174 @@
+"""
+정확성 속성 배치 검증 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from src.generators import ContentSourceClient, DailyContentGenerator, StubContentSource
+from src.models import CurriculumConfig, DayOverview, Syllabus, Week
+from src.validators import ColumnBuilder, PropertyCheckEngine
+
+from .conftest import build_syllabus
+
+
+# 4주 x 7일 + 2일 구성의 30일 실러버스 (주제, 서비스)
+FULL_TOPICS = [
+    ("VPC Networking", ["VPC"]),
+    ("EC2 Compute", ["EC2"]),
+    ("S3 Storage", ["S3"]),
+    ("RDS Database", ["RDS"]),
+    ("IAM Security", ["IAM"]),
+    ("CloudWatch Monitoring", ["CloudWatch"]),
+    ("Week 1 Review", ["VPC", "EC2"]),
+    ("Multi-AZ High Availability", ["ELB"]),
+    ("AWS Config Governance", ["Config"]),
+    ("Tagging Strategy", ["Organizations"]),
+    ("Cost Optimization", ["Budgets"]),
+]
+
+
+def build_full_syllabus(topics=FULL_TOPICS) -> Syllabus:
+    """30일 실러버스 생성 (지정하지 않은 일차는 Lambda 주제)"""
+    weeks = []
+    global_day = 1
+    for week_number, day_count in ((1, 7), (2, 7), (3, 7), (4, 9)):
+        days = []
+        for day_number in range(1, day_count + 1):
+            topic, services = (
+                topics[global_day - 1] if global_day <= len(topics) else (f"Lambda {global_day}", ["Lambda"])
+            )
+            days.append(
+                DayOverview(
+                    day_number=min(day_number, 7),
+                    global_day_number=global_day,
+                    topic=topic,
+                    aws_services=services,
+                )
+            )
+            global_day += 1
+        weeks.append(Week(week_number=week_number, theme=f"Week {week_number}", description="설명", days=days))
+    return Syllabus(weeks=weeks)
+
+
+def generate(syllabus, config):
+    generator = DailyContentGenerator(ContentSourceClient(StubContentSource()), config)
+    return asyncio.run(generator.generate_syllabus_content(syllabus))
+
+
+def results_by_id(results):
+    return {result.property_id: result for result in results}
+
+
+class TestColumnBuilder:
+    """열 평탄화 테스트"""
+
+    def test_rows_follow_syllabus_days(self):
+        builder = ColumnBuilder()
+        builder.add(build_syllabus(), CurriculumConfig(weak_areas=["Networking"]))
+        builder.add(build_syllabus(weeks=1), CurriculumConfig(weak_areas=["Serverless"]))
+        columns = builder.build()
+
+        assert columns.num_rows == 6
+        assert columns.num_curricula == 2
+        assert columns.curriculum.tolist() == [0, 0, 0, 0, 1, 1]
+        assert columns.day.tolist() == [1, 2, 3, 4, 1, 2]
+        assert not columns.has_content.any()
+        # 알려지지 않은 약점 영역은 새 영역으로 추가
+        assert "Serverless" in columns.areas
+        networking = columns.area_bit("Networking")
+        assert int(columns.area_mask[0]) & networking
+        assert not int(columns.area_mask[1]) & networking
+
+
+class TestPropertyCheckEngine:
+    """속성 검증 테스트"""
+
+    def test_generated_curriculum_passes_content_properties(self):
+        syllabus = build_full_syllabus()
+        config = CurriculumConfig()
+        results = results_by_id(PropertyCheckEngine().audit([(syllabus, config, generate(syllabus, config))]))
+
+        for property_id in (1, 2, 3, 5, 7, 9, 10, 11, 12, 15, 16, 18, 20, 21):
+            assert results[property_id].passed, results[property_id]
+        # 스텁 소스는 CI/CD 파이프라인을 생성하지 않음
+        assert len(results[13].violating_days) == 30
+
+    def test_violations_are_reported_per_day(self):
+        syllabus = build_full_syllabus()
+        config = CurriculumConfig()
+        contents = generate(syllabus, config)
+        contents[1].cdk_lab.instance_type = "m5.large"
+        contents[4].cdk_lab.cleanup_config.removal_policy = "RETAIN"
+        contents[5].quiz.questions[0].related_concept = "Unrelated"
+        # Day 7은 VPC, EC2를 실습하지만 EC2 정리 단계만 남김
+        contents[6].console_lab.cleanup_steps = [
+            step for step in contents[6].console_lab.cleanup_steps if step.resource_type == "EC2"
+        ]
+
+        engine = PropertyCheckEngine()
+        results = results_by_id(engine.audit([(syllabus, config, contents)]))
+
+        assert results[10].violating_days == [(0, 2)]
+        assert results[12].violating_days == [(0, 5)]
+        assert results[21].violating_days == [(0, 6)]
+        assert results[9].violating_days == [(0, 7)]
+
+    def test_contents_are_consumed_as_a_stream(self):
+        """콘텐츠를 일차 순서대로 하나씩 소비 (누락된 일차는 미생성으로 처리)"""
+        syllabus = build_syllabus()
+        config = CurriculumConfig()
+        contents = generate(syllabus, config)
+        consumed = []
+
+        def stream():
+            for content in (contents[0], contents[2], contents[3]):
+                consumed.append(content.metadata.global_day_number)
+                yield content
+
+        builder = ColumnBuilder()
+        builder.add(syllabus, config, stream())
+        columns = builder.build()
+
+        assert columns.has_content.tolist() == [True, False, True, True]
+        assert consumed == [1, 3, 4]
+
+    def test_out_of_order_or_unknown_contents_are_rejected(self):
+        """순서가 어긋나거나 실러버스에 없는 일차의 콘텐츠는 건너뛰지 않고 오류"""
+        syllabus = build_syllabus()
+        config = CurriculumConfig()
+        day1, day2, day3, day4 = generate(syllabus, config)
+        extra = generate(build_syllabus(weeks=3), config)[4]
+
+        builder = ColumnBuilder()
+        for contents in ([day3, day1, day2, day4], [day1, day1, day2], [day1, day2, day3, day4, extra]):
+            with pytest.raises(ValueError, match="오름차순"):
+                builder.add(syllabus, config, iter(contents))
+
+        # 실패한 커리큘럼의 행은 남지 않음
+        assert builder.add(syllabus, config, iter([day1, day4])) == 0
+        columns = builder.build()
+        assert columns.num_curricula == 1
+        assert columns.has_content.tolist() == [True, False, False, True]
+
+    def test_batch_audit_isolates_curricula(self):
+        good = build_full_syllabus()
+        # Networking 주제가 3주차에 처음 등장하고, 통합 시나리오가 너무 일찍 배치됨
+        late_topics = [("Integration Scenario", ["Lambda"])] + [
+            (f"Lambda {n}", ["Lambda"]) for n in range(2, 16)
+        ] + [("VPC Networking", ["VPC"])]
+        late = build_full_syllabus(late_topics)
+        config = CurriculumConfig(weak_areas=["Networking"])
+
+        results = results_by_id(
+            PropertyCheckEngine().audit([(good, config, None), (late, config, None), (good, config, None)])
+        )
+
+        assert results[2].violating_days == [(1, 16)]
+        assert results[2].violating_curricula == [1]
+        assert results[3].violating_days == [(1, 1)]
+        # Storage, Database 등 필수 도메인 누락
+        assert results[1].violating_curricula == [1]
+        assert results[15].violating_curricula == [1]
+        assert results[10].passed
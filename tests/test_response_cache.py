@@ -0,0 +1,237 @@
+"""
+응답 캐시 테스트
+"""
+
+import asyncio
+import sqlite3
+import threading
+
+from src.generators import (
+    ContentRequest,
+    ContentSourceClient,
+    DailyContentGenerator,
+    LocalContentPackSource,
+    ResponseCache,
+    StubContentSource,
+)
+from src.models import CurriculumConfig, DayOverview
+
+from .conftest import build_syllabus
+
+
+def make_request(section: str = "overview", day: int = 1, topic: str = "VPC Basics") -> ContentRequest:
+    """테스트용 요청 생성"""
+    return ContentRequest.for_section(
+        section,
+        DayOverview(day_number=1, global_day_number=day, topic=topic, aws_services=["VPC"]),
+        CurriculumConfig(),
+    )
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingStubSource(StubContentSource):
+    """호출 횟수를 세는 스텁 소스"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch(self, request):
+        self.calls += 1
+        return await super().fetch(request)
+
+
+class TestResponseCache:
+    """2단계 캐시 동작 테스트"""
+
+    def test_memory_and_disk_hits(self, tmp_path):
+        """메모리 미스 시 디스크에서 적중"""
+        db_path = str(tmp_path / "cache.sqlite3")
+        cache = ResponseCache(db_path)
+        cache.put(make_request(), {"description": "개요"})
+        assert cache.get(make_request()) == {"description": "개요"}
+        assert cache.stats.memory_hits == 1
+        cache.close()
+
+        reopened = ResponseCache(db_path)
+        assert reopened.get(make_request()) == {"description": "개요"}
+        assert reopened.get(make_request()) == {"description": "개요"}
+        assert reopened.get(make_request(topic="Other")) is None
+        assert reopened.stats.disk_hits == 1
+        assert reopened.stats.memory_hits == 1
+        assert reopened.stats.misses == 1
+        assert reopened.stats.hit_rate == 2 / 3
+
+    def test_lru_size_eviction(self, tmp_path):
+        """메모리/디스크 크기 제한으로 오래된 항목 제거"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_memory_entries=2, max_disk_entries=3)
+        clock = FakeClock()
+        cache.clock = clock
+        for index in range(4):
+            clock.now += 1
+            cache.put(make_request(topic=f"T{index}"), {"index": index})
+
+        assert cache.get(make_request(topic="T0")) is None
+        assert cache.get(make_request(topic="T1")) == {"index": 1}
+        assert cache.stats.disk_hits == 1
+        assert cache.stats.evictions == 1
+
+    def test_memory_only_eviction(self):
+        """디스크 없이 메모리 LRU만 사용"""
+        cache = ResponseCache(max_memory_entries=1)
+        cache.put(make_request(topic="A"), {"a": 1})
+        cache.put(make_request(topic="B"), {"b": 1})
+
+        assert cache.get(make_request(topic="A")) is None
+        assert cache.get(make_request(topic="B")) == {"b": 1}
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        """TTL이 지나면 미적중"""
+        clock = FakeClock()
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60, clock=clock)
+        cache.put(make_request(), {"description": "개요"})
+
+        clock.now += 30
+        assert cache.get(make_request()) is not None
+        clock.now += 31
+        assert cache.get(make_request()) is None
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_by_day_and_section(self, tmp_path):
+        """일차/섹션 단위 무효화"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+        for day in (1, 2):
+            for section in ("overview", "quiz"):
+                cache.put(make_request(section, day=day, topic=f"Day {day}"), {"day": day})
+
+        assert cache.invalidate(day=1, section="quiz") == 1
+        assert cache.get(make_request("quiz", day=1, topic="Day 1")) is None
+        assert cache.get(make_request("overview", day=1, topic="Day 1")) is not None
+
+        assert cache.invalidate(day=2) == 2
+        assert cache.get(make_request("overview", day=2, topic="Day 2")) is None
+
+        assert cache.invalidate(section="overview") == 1
+        assert cache.invalidate() == 0
+
+
+    def test_uses_rollback_journal_and_thread_connections(self, tmp_path):
+        """공유 파일시스템용 롤백 저널을 사용하고 스레드마다 별도 연결로 접근"""
+        db_path = tmp_path / "cache.sqlite3"
+        legacy = sqlite3.connect(str(db_path))
+        legacy.execute("PRAGMA journal_mode=WAL")
+        legacy.close()
+
+        cache = ResponseCache(str(db_path))
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+        def put_and_get(day):
+            request = make_request(day=day, topic=f"Day {day}")
+            cache.put(request, {"day": day})
+            assert cache.get(request) == {"day": day}
+
+        threads = [threading.Thread(target=put_and_get, args=(day,)) for day in range(1, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache._connections) == 5
+        assert cache.stats.memory_hits == 4
+        cache.close()
+        assert cache._connections == []
+
+
+class TestCachedGeneration:
+    """클라이언트 연동 테스트"""
+
+    def test_regeneration_hits_unaffected_sections(self, tmp_path):
+        """약점 영역만 바꾼 재생성은 바뀐 일차만 다시 요청"""
+        source = CountingStubSource()
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+        syllabus = build_syllabus()
+
+        first = DailyContentGenerator(ContentSourceClient(source, cache=cache), CurriculumConfig())
+        asyncio.run(first.generate_syllabus_content(syllabus))
+        assert source.calls == 4 * 8
+
+        # 약점 영역 조정으로 Day 4 주제만 바뀐 실러버스
+        tweaked = build_syllabus()
+        tweaked.weeks[1].days[1].topic = "Governance Deep Dive"
+        config = CurriculumConfig(weak_areas=["Networking", "Governance"])
+
+        second = DailyContentGenerator(ContentSourceClient(source, cache=cache), config)
+        asyncio.run(second.generate_syllabus_content(tweaked))
+
+        assert source.calls == 4 * 8 + 8
+        assert cache.stats.hits == 3 * 8
+
+    def test_source_change_misses_cache(self, tmp_path):
+        """소스를 바꾸거나 팩 파일을 수정하면 이전 응답을 쓰지 않음"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+        pack = tmp_path / "pack"
+        pack.mkdir()
+        day_file = pack / "day1.yaml"
+        day_file.write_text("overview:\n  description: 팩 개요\n", encoding="utf-8")
+
+        stub = asyncio.run(ContentSourceClient(StubContentSource(), cache=cache).fetch(make_request()))
+        first = asyncio.run(ContentSourceClient(LocalContentPackSource(str(pack)), cache=cache).fetch(make_request()))
+        assert first == {"description": "팩 개요"} != stub
+
+        day_file.write_text("overview:\n  description: 수정된 개요\n", encoding="utf-8")
+        second = asyncio.run(ContentSourceClient(LocalContentPackSource(str(pack)), cache=cache).fetch(make_request()))
+        assert second == {"description": "수정된 개요"}
+        assert cache.stats.hits == 0
+
+    def test_edited_pack_file_reloads_in_same_source(self, tmp_path):
+        """오래 실행되는 소스도 수정된 팩 파일을 다시 읽고, 새 키에 이전 내용을 저장하지 않음"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+        pack = tmp_path / "pack"
+        pack.mkdir()
+        day_file = pack / "day1.yaml"
+        day_file.write_text("overview:\n  description: 팩 개요\n", encoding="utf-8")
+        client = ContentSourceClient(LocalContentPackSource(str(pack)), cache=cache)
+
+        assert asyncio.run(client.fetch(make_request())) == {"description": "팩 개요"}
+
+        day_file.write_text("overview:\n  description: 수정된 개요입니다\n", encoding="utf-8")
+        assert asyncio.run(client.fetch(make_request())) == {"description": "수정된 개요입니다"}
+
+        fresh = ResponseCache(str(tmp_path / "cache.sqlite3"))
+        key = client.source.request_key(make_request())
+        assert fresh.get(make_request(), key) == {"description": "수정된 개요입니다"}
+
+    def test_cache_write_failure_resolves_waiters(self):
+        """캐시 저장이 실패해도 같은 키를 기다리는 요청이 모두 완료됨"""
+
+        class FailingCache(ResponseCache):
+            def put(self, request, payload, key=None):
+                raise sqlite3.OperationalError("database is locked")
+
+        source = CountingStubSource()
+        cache = FailingCache()
+        client = ContentSourceClient(source, cache=cache)
+
+        async def run():
+            # 스텁은 일차 번호로 키를 구분하지 않으므로 두 요청이 하나로 병합됨
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    client.fetch(make_request(day=1)),
+                    client.fetch(make_request(day=2)),
+                ),
+                timeout=5,
+            )
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert source.calls == 1
+        assert cache.stats.errors == 1
@@ -0,0 +1,79 @@
+"""
+실러버스 및 색인 렌더링 테스트
+"""
+
+import asyncio
+import json
+
+from src.generators import (
+    ContentSourceClient,
+    DailyContentGenerator,
+    StubContentSource,
+    iter_daily_content,
+    iter_generated_days,
+    render_syllabus_outputs,
+)
+from src.generators.output_writer import save_daily_content
+
+
+def generate_some(syllabus, config, output_directory, days):
+    """지정한 일차만 콘텐츠를 생성해 저장"""
+    generator = DailyContentGenerator(ContentSourceClient(StubContentSource()), config)
+    contents = asyncio.run(generator.generate_syllabus_content(syllabus))
+    for content in contents:
+        if content.metadata.global_day_number in days:
+            save_daily_content(content, str(output_directory))
+
+
+class TestDayIterators:
+    """일차 순회 API 테스트"""
+
+    def test_syllabus_iter_days(self, sample_syllabus):
+        """주차 순서대로 (주차, 일차) 반환"""
+        pairs = [(week.week_number, day.global_day_number) for week, day in sample_syllabus.iter_days()]
+        assert pairs == [(1, 1), (1, 2), (2, 3), (2, 4)]
+
+    def test_iter_daily_content(self, tmp_path, sample_syllabus, config):
+        """출력 트리에서 생성된 일차만 순서대로 로드"""
+        generate_some(sample_syllabus, config, tmp_path, {4, 1, 3})
+
+        days = [content.metadata.global_day_number for content in iter_daily_content(str(tmp_path))]
+        assert days == [1, 3, 4]
+        assert list(iter_daily_content(str(tmp_path / "missing"))) == []
+
+    def test_iter_generated_days_is_lazy(self, tmp_path, sample_syllabus, config):
+        """실러버스 일차와 콘텐츠를 하나씩 반환"""
+        generate_some(sample_syllabus, config, tmp_path, {1})
+
+        iterator = iter_generated_days(sample_syllabus, str(tmp_path))
+        week, day, content = next(iterator)
+        assert (week.week_number, day.global_day_number) == (1, 1)
+        assert content is not None
+        assert [content for _, _, content in iterator] == [None, None, None]
+
+
+class TestRenderSyllabusOutputs:
+    """syllabus.md 및 색인 테스트"""
+
+    def test_renders_all_outputs(self, tmp_path, sample_syllabus, config):
+        """실러버스, 서비스 색인, 검색 색인 생성"""
+        generate_some(sample_syllabus, config, tmp_path, {1, 2, 3})
+
+        outputs = render_syllabus_outputs(sample_syllabus, str(tmp_path))
+
+        assert (outputs.days, outputs.days_with_content) == (4, 3)
+
+        syllabus_md = (tmp_path / "syllabus.md").read_text(encoding="utf-8")
+        assert "## Week 1: Week 1" in syllabus_md
+        assert "### Day 3: Topic 3" in syllabus_md
+        assert "RDS의 핵심 동작 원리를 설명할 수 있다" in syllabus_md
+        assert "- 콘텐츠: 미생성" in syllabus_md
+
+        service_index = (tmp_path / "service_index.md").read_text(encoding="utf-8")
+        assert "## RDS\n\n- [Day 3: Topic 3](week2/day3/README.md)" in service_index
+
+        entries = json.loads((tmp_path / "search_index.json").read_text(encoding="utf-8"))
+        assert [entry["day"] for entry in entries] == [1, 2, 3, 4]
+        assert entries[0]["concepts"] == ["VPC", "EC2"]
+        assert entries[3]["generated"] is False
+        assert not list(tmp_path.glob("*.tmp"))
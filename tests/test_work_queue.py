@@ -0,0 +1,226 @@
+"""
+분산 생성 작업 큐 테스트
+"""
+
+import asyncio
+import sqlite3
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from src.generators import (
+    ContentGenerationError,
+    ContentSourceClient,
+    ContentSourceError,
+    DistributedWorker,
+    StubContentSource,
+    WorkQueue,
+    shard_curricula,
+)
+from src.main import main
+from src.models import CurriculumConfig
+
+from .conftest import build_syllabus
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_curricula():
+    """약점 영역이 다른 학습자 프로필 3개"""
+    syllabus = build_syllabus()
+    return [
+        (syllabus, CurriculumConfig(weak_areas=[area]))
+        for area in ("Networking", "Database", "Storage")
+    ]
+
+
+class TestWorkQueue:
+    """임대 큐 동작 테스트"""
+
+    def test_shard_is_idempotent(self, tmp_path):
+        """같은 커리큘럼을 다시 넣어도 단위가 늘지 않음"""
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        ids = shard_curricula(queue, make_curricula())
+        shard_curricula(queue, make_curricula())
+
+        assert len(set(ids)) == 3
+        assert queue.counts()["pending"] == 3 * 4
+
+    def test_claim_is_exclusive_until_lease_expires(self, tmp_path):
+        """임대 중인 단위는 만료 전까지 다른 워커에게 가지 않음"""
+        clock = FakeClock()
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), clock=clock)
+        queue.add_curriculum(build_syllabus(days_per_week=1, weeks=1), CurriculumConfig())
+
+        first = queue.claim("worker-a", lease_seconds=10)
+        assert first is not None
+        assert queue.claim("worker-b", lease_seconds=10) is None
+
+        clock.now += 11
+        second = queue.claim("worker-b", lease_seconds=10)
+        assert second is not None and second.day == first.day
+        assert second.attempts == 2
+
+        # 임대를 잃은 워커의 완료 보고는 무시됨
+        assert queue.complete(first) is False
+        assert queue.complete(second) is True
+        assert queue.counts()["done"] == 1
+
+    def test_failures_are_retried_then_quarantined(self, tmp_path):
+        """최대 시도 횟수까지 재시도 후 격리"""
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), max_attempts=2)
+        queue.add_curriculum(build_syllabus(days_per_week=1, weeks=1), CurriculumConfig())
+        error = ContentGenerationError(1, "quiz", "서비스 응답 오류")
+
+        queue.fail(queue.claim("worker-a", 10), error)
+        assert queue.counts()["pending"] == 1
+
+        queue.fail(queue.claim("worker-a", 10), error)
+        assert queue.counts()["failed"] == 1
+        [(_, day, section, details)] = queue.failed_units()
+        assert (day, section, details) == (1, "quiz", "서비스 응답 오류")
+
+    def test_each_thread_uses_own_connection(self, tmp_path):
+        """스레드마다 별도 연결로 큐를 사용"""
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        queue.add_curriculum(build_syllabus(), CurriculumConfig())
+        claimed = []
+
+        def claim_all():
+            while (unit := queue.claim(threading.current_thread().name, 10)) is not None:
+                claimed.append(unit.day)
+                assert queue.complete(unit)
+
+        threads = [threading.Thread(target=claim_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == [1, 2, 3, 4]
+        assert len(queue._connections) == 5
+        queue.close()
+        assert queue._connections == []
+
+
+    def test_uses_rollback_journal(self, tmp_path):
+        """네트워크 파일시스템에서도 동작하도록 WAL이 아닌 롤백 저널 사용"""
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        assert queue._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        queue.close()
+
+
+class TestDistributedWorker:
+    """워커 테스트"""
+
+    def test_worker_writes_content_addressed_tree(self, tmp_path):
+        """커리큘럼 ID별 출력 트리 생성"""
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        [curriculum_id] = shard_curricula(queue, make_curricula()[:1])
+        worker = DistributedWorker(queue, ContentSourceClient(StubContentSource()), str(tmp_path / "out"))
+
+        assert asyncio.run(worker.run()) == 4
+        day_dir = tmp_path / "out" / curriculum_id / "week2" / "day4"
+        assert (day_dir / "README.md").exists()
+        assert (day_dir / "part2_cdk" / "README.md").exists()
+        assert not any((tmp_path / "out" / ".staging").iterdir())
+
+    def test_worker_reports_failures(self, tmp_path):
+        """생성 실패는 큐에 보고"""
+
+        class BrokenSource(StubContentSource):
+            async def fetch(self, request):
+                if request.global_day_number == 2:
+                    raise ContentSourceError("오류")
+                return await super().fetch(request)
+
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), max_attempts=1)
+        shard_curricula(queue, make_curricula()[:1])
+        client = ContentSourceClient(BrokenSource(), max_retries=0)
+        worker = DistributedWorker(queue, client, str(tmp_path / "out"))
+
+        assert asyncio.run(worker.run()) == 3
+        assert worker.failed == 1
+        assert [row[1] for row in queue.failed_units()] == [2]
+
+    def test_worker_survives_sqlite_errors(self, tmp_path):
+        """공유 캐시의 SQLite 오류는 해당 단위의 실패로 보고"""
+
+        class LockedSource(StubContentSource):
+            async def fetch(self, request):
+                if request.global_day_number == 3:
+                    raise sqlite3.OperationalError("database is locked")
+                return await super().fetch(request)
+
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), max_attempts=1)
+        shard_curricula(queue, make_curricula()[:1])
+        worker = DistributedWorker(queue, ContentSourceClient(LockedSource()), str(tmp_path / "out"))
+
+        assert asyncio.run(worker.run()) == 3
+        [(_, day, section, details)] = queue.failed_units()
+        assert (day, section, details) == (3, "sqlite", "database is locked")
+
+    def test_worker_command_fails_when_units_fail(self, tmp_path, capsys):
+        """실패한 단위가 있으면 worker 명령은 0이 아닌 값으로 종료"""
+        queue_path = str(tmp_path / "queue.sqlite3")
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("weak_areas: [Networking]\n", encoding="utf-8")
+        syllabus_path = tmp_path / "syllabus.json"
+        syllabus_path.write_text(build_syllabus(weeks=1).model_dump_json(), encoding="utf-8")
+        empty_pack = tmp_path / "pack"
+        empty_pack.mkdir()
+
+        assert main(["enqueue", "--queue", queue_path, "--curriculum", str(config_path), str(syllabus_path)]) == 0
+        exit_code = main([
+            "worker", "--queue", queue_path, "--output", str(tmp_path / "out"),
+            "--content-pack", str(empty_pack), "--max-attempts", "1",
+        ])
+
+        assert exit_code == 1
+        assert "실패 2개" in capsys.readouterr().out
+
+    def test_multiple_worker_processes(self, tmp_path):
+        """여러 워커 프로세스가 중복 없이 모든 단위를 처리"""
+        queue_path = str(tmp_path / "queue.sqlite3")
+        output = tmp_path / "out"
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("weak_areas: [Networking]\n", encoding="utf-8")
+        curriculum_args = []
+        for weeks in (1, 2, 3):
+            syllabus_path = tmp_path / f"syllabus{weeks}.json"
+            syllabus_path.write_text(build_syllabus(weeks=weeks).model_dump_json(), encoding="utf-8")
+            curriculum_args += ["--curriculum", str(config_path), str(syllabus_path)]
+
+        command = [sys.executable, "-m", "src.main"]
+        subprocess.run(command + ["enqueue", "--queue", queue_path] + curriculum_args, cwd=PROJECT_ROOT, check=True)
+
+        workers = [
+            subprocess.Popen(
+                command + ["worker", "--queue", queue_path, "--output", str(output), "--parallel-units", "2"],
+                cwd=PROJECT_ROOT,
+                stdout=subprocess.PIPE,
+            )
+            for _ in range(3)
+        ]
+        for process in workers:
+            process.communicate(timeout=120)
+            assert process.returncode == 0
+
+        queue = WorkQueue(queue_path)
+        total_units = 2 + 4 + 6
+        assert queue.counts() == {"pending": 0, "leased": 0, "done": total_units, "failed": 0}
+        attempts = [row[0] for row in queue._conn.execute("SELECT attempts FROM units")]
+        assert attempts == [1] * total_units
+        assert len(list(output.glob("*/week*/day*/README.md"))) == total_units